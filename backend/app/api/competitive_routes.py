@@ -40,16 +40,16 @@ async def analyze_competitors(request: CompetitorAnalysisRequest):
     try:
         logger.info(f"Analyzing competitors for {request.your_brand}")
 
-        client = DataForSEOClient()
-        tracker = CompetitorTracker(client)
+        async with DataForSEOClient() as client:
+            tracker = CompetitorTracker(client)
 
-        results = await tracker.analyze_competitors(
-            your_brand=request.your_brand,
-            competitor_brands=request.competitor_brands,
-            platforms=request.platforms,
-            keywords=request.keywords,
-            location=request.location
-        )
+            results = await tracker.analyze_competitors(
+                your_brand=request.your_brand,
+                competitor_brands=request.competitor_brands,
+                platforms=request.platforms,
+                keywords=request.keywords,
+                location=request.location
+            )
 
         return {
             "success": True,
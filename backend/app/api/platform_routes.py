@@ -54,14 +54,14 @@ async def analyze_platforms(request: PlatformAnalysisRequest):
     try:
         logger.info(f"Platform analysis requested for {len(request.keywords)} keywords")
 
-        client = DataForSEOClient()
-        orchestrator = PlatformOrchestrator(client)
+        async with DataForSEOClient() as client:
+            orchestrator = PlatformOrchestrator(client)
 
-        results = await orchestrator.analyze_all_platforms(
-            seed_keywords=request.keywords,
-            platforms=request.platforms,
-            location=request.location
-        )
+            results = await orchestrator.analyze_all_platforms(
+                seed_keywords=request.keywords,
+                platforms=request.platforms,
+                location=request.location
+            )
 
         return {
             "success": True,
@@ -121,16 +121,16 @@ async def generate_multi_platform_strategy(request: MultiPlatformStrategyRequest
     try:
         logger.info(f"Multi-platform strategy requested for: {request.niche_keywords}")
 
-        client = DataForSEOClient()
-        orchestrator = PlatformOrchestrator(client)
         matcher = IntentMatcher()
 
         # Step 1: Platform analysis
-        platform_results = await orchestrator.analyze_all_platforms(
-            seed_keywords=request.niche_keywords,
-            platforms=request.target_platforms,
-            location=request.location
-        )
+        async with DataForSEOClient() as client:
+            orchestrator = PlatformOrchestrator(client)
+            platform_results = await orchestrator.analyze_all_platforms(
+                seed_keywords=request.niche_keywords,
+                platforms=request.target_platforms,
+                location=request.location
+            )
 
         # Step 2: Extract all discovered keywords
         all_keywords = []
@@ -492,11 +492,14 @@ async def run_competitor_comparison(
         comparison_tasks[comparison_id]["progress"] = 10
 
         # Run full competitor analysis
-        results = await analyzer.analyze_competitors(
-            user_url=user_url,
-            competitor_urls=competitor_urls,
-            max_pages=max_pages
-        )
+        try:
+            results = await analyzer.analyze_competitors(
+                user_url=user_url,
+                competitor_urls=competitor_urls,
+                max_pages=max_pages
+            )
+        finally:
+            await analyzer.aclose()
 
         comparison_tasks[comparison_id]["progress"] = 90
         comparison_tasks[comparison_id]["status"] = CompetitorComparisonStatus.ANALYZING
@@ -558,7 +561,10 @@ async def run_audit(task_id: str, url: str, max_pages: int):
 
         # Step 1: Crawl website
         crawler = SiteCrawler()
-        crawl_data = await crawler.crawl_site(url, max_pages)
+        try:
+            crawl_data = await crawler.crawl_site(url, max_pages)
+        finally:
+            await crawler.aclose()
 
         audit_tasks[task_id]["progress"] = 60
         audit_tasks[task_id]["status"] = AuditStatus.PROCESSING
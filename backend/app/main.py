@@ -19,6 +19,7 @@ from app.api.generation_routes import router as generation_router
 from app.api.entity_routes import router as entity_router
 from app.api.local_routes import router as local_router
 from app.services.dataforseo_client import DataForSEOClient
+from app.services.entity.about_optimizer import shutdown_process_pool
 
 # Configure logging
 logging.basicConfig(
@@ -48,6 +49,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down SERP-Master API")
+    shutdown_process_pool()
 
 
 # Create FastAPI app
@@ -34,6 +34,10 @@ class CompetitorAnalyzer:
         self.aeo_scorer = AEOScorer()
         self.issue_analyzer = IssueAnalyzer()
 
+    async def aclose(self):
+        """Release the crawler's HTTP session"""
+        await self.crawler.aclose()
+
     async def analyze_competitors(
         self,
         user_url: str,
@@ -4,14 +4,70 @@ Analyzes content for AEO (Answer Engine Optimization) scoring
 Focuses on FAQ pages, question headers, and readability
 """
 
+import json
 import logging
+import os
 import re
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import textstat
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Markup that never contributes visible text (comments, script and style bodies)
+_NON_TEXT_RE = re.compile(r'<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# HTML parser for byte input that ignores any declared document encoding
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+# Q&A patterns: "q:", "q1:", "a:", "question:", "answer:", "frequently asked"
+_QA_RE = re.compile(r'q\d*:|a:|question:|answer:|frequently asked')
+
+
+@lru_cache(maxsize=1024)
+def _score_text(text: str) -> tuple:
+    """
+    Score extracted text with textstat, memoized on the text itself so
+    re-analysis and shared boilerplate skip the word/syllable recounts
+
+    Returns:
+        (flesch_reading_ease, flesch_kincaid_grade, word_count)
+    """
+    return (
+        textstat.flesch_reading_ease(text),
+        textstat.flesch_kincaid_grade(text),
+        len(text.split())
+    )
+
+
+def _parse_html(html: str) -> Optional[lxml_html.HtmlElement]:
+    """
+    Parse an HTML document with lxml
+
+    Returns:
+        Root element, or None for documents without elements (only
+        whitespace or comments)
+    """
+    try:
+        try:
+            return lxml_html.fromstring(html)
+        except ValueError:
+            # lxml rejects str input carrying an XML encoding declaration;
+            # parse the UTF-8 bytes with the declaration overridden instead
+            return lxml_html.fromstring(html.encode('utf-8'), parser=_UTF8_HTML_PARSER)
+    except etree.ParserError:
+        return None
+
 
 class ContentAnalyzer:
     """
@@ -24,11 +80,11 @@ class ContentAnalyzer:
     """
 
     # Question words that indicate conversational content
-    QUESTION_WORDS = [
+    QUESTION_WORDS = frozenset({
         'who', 'what', 'when', 'where', 'why', 'how',
         'can', 'does', 'is', 'should', 'will', 'would',
         'could', 'are', 'do', 'did', 'has', 'have'
-    ]
+    })
 
     # FAQ page indicators
     FAQ_INDICATORS = [
@@ -50,6 +106,11 @@ class ContentAnalyzer:
             pages = site_data.get('pages', [])
             html_content = site_data.get('html', '')
 
+            # Decode raw crawl bytes once so the parsers below never have to
+            # guess the encoding
+            if isinstance(html_content, bytes):
+                html_content = html_content.decode('utf-8', errors='replace')
+
             # Analyze FAQ pages
             faq_analysis = self.detect_faq_pages(pages, html_content)
 
@@ -91,6 +152,31 @@ class ContentAnalyzer:
                 "recommendations": ["Fix content parsing errors before analyzing conversational patterns"]
             }
 
+    def calculate_conversational_scores_batch(
+        self,
+        sites: List[Dict[str, Any]],
+        max_workers: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate conversational scores for many sites in parallel
+
+        Each site is scored independently and the work is CPU-bound, so sites
+        are spread across a process pool. Single-site batches run inline.
+
+        Args:
+            sites: List of site data dicts (same shape as calculate_conversational_score)
+            max_workers: Pool size, defaults to the CPU count
+
+        Returns:
+            List of conversational score results in the same order as sites
+        """
+        if len(sites) <= 1:
+            return [self.calculate_conversational_score(site) for site in sites]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(sites))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.calculate_conversational_score, sites, chunksize=4))
+
     def detect_faq_pages(self, pages: List[Dict], html_content: str = "") -> Dict[str, Any]:
         """
         Detect FAQ pages and schema markup
@@ -111,11 +197,12 @@ class ContentAnalyzer:
                 if page is None:
                     continue
 
-                url = page.get('url', '').lower()
-                title = page.get('title', '').lower()
+                # One lowercased "url<US>title" string per page; the separator
+                # keeps indicators from matching across the boundary
+                url_title = (page.get('url', '') + '\x1f' + page.get('title', '')).lower()
 
                 # Check if URL or title indicates FAQ page
-                is_faq = any(indicator in url or indicator in title for indicator in self.FAQ_INDICATORS)
+                is_faq = any(indicator in url_title for indicator in self.FAQ_INDICATORS)
 
                 if is_faq:
                     faq_pages.append(page.get('url', ''))
@@ -128,21 +215,24 @@ class ContentAnalyzer:
             jsonld_scripts = soup.find_all('script', type='application/ld+json')
             for script in jsonld_scripts:
                 try:
-                    import json
-                    schema_data = json.loads(script.string)
-
-                    # Handle both single schema and array
-                    schemas_to_check = schema_data if isinstance(schema_data, list) else [schema_data]
-
-                    for schema in schemas_to_check:
-                        if isinstance(schema, dict):
-                            schema_type = schema.get('@type', '')
-                            if schema_type == 'FAQPage':
-                                has_faq_schema = True
-                                break
-                except:
+                    # orjson only accepts exact str, not bs4's NavigableString subclass
+                    schema_data = _json_loads(str(script.string or ''))
+                except ValueError:
                     continue
 
+                # Handle both single schema and array
+                if isinstance(schema_data, list):
+                    has_faq_schema = any(
+                        isinstance(schema, dict) and schema.get('@type') == 'FAQPage'
+                        for schema in schema_data
+                    )
+                elif isinstance(schema_data, dict):
+                    has_faq_schema = schema_data.get('@type') == 'FAQPage'
+
+                # One FAQPage schema is enough, skip the remaining scripts
+                if has_faq_schema:
+                    break
+
         # Calculate score
         points = 0
         if has_faq_schema and len(faq_pages) > 0:
@@ -167,20 +257,11 @@ class ContentAnalyzer:
         if not html_content:
             return False
 
-        soup = BeautifulSoup(html_content, 'lxml')
-        text = soup.get_text().lower()
+        # Only text presence matters here, so strip markup with regexes
+        # instead of building a DOM
+        text = _TAG_RE.sub('', _NON_TEXT_RE.sub(' ', html_content)).lower()
 
-        # Look for Q&A patterns
-        qa_patterns = [
-            r'q:', r'a:', r'question:', r'answer:',
-            r'q\d+:', r'frequently asked'
-        ]
-
-        for pattern in qa_patterns:
-            if re.search(pattern, text):
-                return True
-
-        return False
+        return _QA_RE.search(text) is not None
 
     def _get_faq_status(self, points: int) -> str:
         """Get human-readable FAQ status"""
@@ -210,19 +291,13 @@ class ContentAnalyzer:
                 "points": 0
             }
 
-        soup = BeautifulSoup(html_content, 'lxml')
-
-        # Find all headers (H2, H3 are most common for questions)
-        headers = soup.find_all(['h2', 'h3'])
-
-        question_headers = []
-
-        for header in headers:
-            text = header.get_text().strip()
+        # Find all headers (H2, H3 are most common for questions), reading
+        # their text straight from the lxml tree
+        root = _parse_html(html_content)
+        headers = root.xpath('//h2|//h3') if root is not None else []
+        texts = [header.text_content().strip() for header in headers]
 
-            # Check if it's a question
-            if self.is_question(text):
-                question_headers.append(text)
+        question_headers = [text for text in texts if self.is_question(text)]
 
         # Calculate score
         count = len(question_headers)
@@ -253,16 +328,14 @@ class ContentAnalyzer:
         if not text:
             return False
 
-        text_lower = text.lower().strip()
-
         # Check if ends with question mark
-        if text.endswith('?'):
+        if text[-1] == '?':
             return True
 
-        # Check if starts with question word
-        first_word = text_lower.split()[0] if text_lower.split() else ""
+        # Check if starts with question word (only the first word is lowercased)
+        words = text.split(None, 1)
 
-        return first_word in self.QUESTION_WORDS
+        return bool(words) and words[0].lower() in self.QUESTION_WORDS
 
     def _get_question_status(self, count: int) -> str:
         """Get human-readable question header status"""
@@ -303,11 +376,8 @@ class ContentAnalyzer:
                     "points": 0
                 }
 
-            # Calculate Flesch Reading Ease
-            flesch_score = textstat.flesch_reading_ease(text)
-
-            # Calculate grade level
-            grade_level = textstat.flesch_kincaid_grade(text)
+            # Calculate Flesch Reading Ease and grade level
+            flesch_score, grade_level, word_count = _score_text(text)
 
             # Determine difficulty and points
             if flesch_score >= 60:
@@ -329,7 +399,7 @@ class ContentAnalyzer:
                 "difficulty": difficulty,
                 "description": description,
                 "points": points,
-                "word_count": len(text.split())
+                "word_count": word_count
             }
 
         except Exception as e:
@@ -352,21 +422,15 @@ class ContentAnalyzer:
         Returns:
             Plain text content
         """
-        soup = BeautifulSoup(html, 'lxml')
-
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-
-        # Get text
-        text = soup.get_text()
+        tree = _parse_html(html)
+        if tree is None:
+            return ''
 
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        # Remove script, style and page chrome (keeping the text that follows them)
+        etree.strip_elements(tree, "script", "style", "nav", "footer", "header", with_tail=False)
 
-        return text
+        # Get text and collapse whitespace in a single pass
+        return re.sub(r'\s+', ' ', tree.text_content()).strip()
 
     def _generate_recommendations(
         self,
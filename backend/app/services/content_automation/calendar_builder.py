@@ -3,6 +3,7 @@ Automated Content Calendar Builder
 Generate publishing schedules based on platform best practices
 """
 
+from collections import Counter, deque
 from typing import List, Dict
 from datetime import datetime, timedelta
 from enum import Enum
@@ -49,6 +50,29 @@ class CalendarBuilder:
         ]
     }
 
+    DAY_OFFSETS = {
+        "mon": 0, "tue": 1, "wed": 2, "thu": 3,
+        "fri": 4, "sat": 5, "sun": 6
+    }
+
+    # Fallback slot for platforms without best-time data
+    DEFAULT_TIME_SLOT = (0, 12, 0, "Default")
+
+    def __init__(self):
+        # Pre-parse BEST_TIMES into (day_offset, hour, minute, reason) tuples
+        # so scheduling doesn't re-parse day names and "HH:MM" strings per item
+        self._best_times = {
+            platform: [
+                (
+                    self.DAY_OFFSETS.get(slot["day"], 0),
+                    *map(int, slot["time"].split(":")),
+                    slot["reason"]
+                )
+                for slot in slots
+            ]
+            for platform, slots in self.BEST_TIMES.items()
+        }
+
     def generate_calendar(
         self,
         content_items: List[Dict],
@@ -59,6 +83,10 @@ class CalendarBuilder:
         """
         Generate content calendar with optimal posting times
 
+        Scheduled items are annotated in place (scheduled_date, week_number,
+        time_slot_reason) rather than copied, so content_items should be
+        dicts the caller owns.
+
         Returns complete calendar with scheduling recommendations
         """
         try:
@@ -80,12 +108,13 @@ class CalendarBuilder:
             for item in content_items:
                 platform = item.get("platform", "blog")
                 if platform not in platform_content:
-                    platform_content[platform] = []
+                    platform_content[platform] = deque()
                 platform_content[platform].append(item)
 
             # Schedule content week by week
             current_date = start_date
             week_number = 1
+            by_platform = Counter()
 
             while week_number <= duration_weeks and any(platform_content.values()):
                 week_start = current_date
@@ -98,31 +127,27 @@ class CalendarBuilder:
 
                     # Determine posts per week
                     posts_per_week = self._get_posts_per_week(platform, frequency)
-                    best_times = self.BEST_TIMES.get(platform, [
-                        {"day": "mon", "time": "12:00", "reason": "Default"}
-                    ])
+                    best_times = self._best_times.get(platform, [self.DEFAULT_TIME_SLOT])
 
                     # Schedule posts
                     for i in range(posts_per_week):
                         if not content_list:
                             break
 
-                        content_item = content_list.pop(0)
-                        time_slot = best_times[i % len(best_times)]
+                        content_item = content_list.popleft()
+                        day_offset, hour, minute, reason = best_times[i % len(best_times)]
 
                         publish_date = self._calculate_publish_datetime(
-                            week_start, time_slot["day"], time_slot["time"]
+                            week_start, day_offset, hour, minute
                         )
 
-                        scheduled_item = {
-                            **content_item,
-                            "scheduled_date": publish_date.isoformat(),
-                            "week_number": week_number,
-                            "time_slot_reason": time_slot["reason"]
-                        }
+                        content_item["scheduled_date"] = publish_date.isoformat()
+                        content_item["week_number"] = week_number
+                        content_item["time_slot_reason"] = reason
 
-                        week_content.append(scheduled_item)
-                        calendar["scheduled_content"].append(scheduled_item)
+                        week_content.append(content_item)
+                        calendar["scheduled_content"].append(content_item)
+                        by_platform[content_item["platform"]] += 1
 
                 # Update summary
                 calendar["summary"]["by_week"][f"week_{week_number}"] = {
@@ -136,11 +161,7 @@ class CalendarBuilder:
 
             # Final summary
             calendar["summary"]["total_items"] = len(calendar["scheduled_content"])
-
-            for item in calendar["scheduled_content"]:
-                platform = item["platform"]
-                calendar["summary"]["by_platform"][platform] = \
-                    calendar["summary"]["by_platform"].get(platform, 0) + 1
+            calendar["summary"]["by_platform"] = dict(by_platform)
 
             return calendar
 
@@ -177,24 +198,13 @@ class CalendarBuilder:
     def _calculate_publish_datetime(
         self,
         week_start: datetime,
-        day: str,
-        time: str
+        day_offset: int,
+        hour: int,
+        minute: int
     ) -> datetime:
-        """Calculate exact publish datetime"""
-
-        day_offsets = {
-            "mon": 0, "tue": 1, "wed": 2, "thu": 3,
-            "fri": 4, "sat": 5, "sun": 6
-        }
-
-        day_offset = day_offsets.get(day, 0)
-        publish_date = week_start + timedelta(days=day_offset)
-
-        # Parse time
-        hour, minute = map(int, time.split(':'))
-        publish_datetime = publish_date.replace(hour=hour, minute=minute)
+        """Calculate exact publish datetime from a pre-parsed time slot"""
 
-        return publish_datetime
+        return week_start.replace(hour=hour, minute=minute) + timedelta(days=day_offset)
 
     def export_to_google_calendar(self, calendar: Dict) -> Dict:
         """Format calendar for Google Calendar import (CSV format)"""
@@ -5,6 +5,7 @@ Create ready-to-use content frameworks for each platform
 
 from typing import List, Dict, Optional
 from enum import Enum
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,171 @@ class ContentPlatform(str, Enum):
     INSTAGRAM = "instagram"
 
 
+# Static template parts are built once at import and shared between calls;
+# only the keyword-dependent strings are produced per template. Callers must
+# treat these nested objects as read-only.
+
+_YOUTUBE_STRUCTURE = {
+    "intro": {
+        "duration": "0-15 seconds",
+        "purpose": "Hook viewer attention",
+        "elements": ["Problem statement", "Promise of solution"]
+    },
+    "main_content": {
+        "duration": "5-15 minutes",
+        "purpose": "Deliver value",
+        "elements": ["Main points (3-5)", "Examples", "Visual aids"]
+    },
+    "conclusion": {
+        "duration": "30-60 seconds",
+        "purpose": "Call to action",
+        "elements": ["Summary", "CTA (subscribe/like/comment)"]
+    }
+}
+
+_YOUTUBE_TITLE_FMTS = (
+    "How to {} (Complete Guide)",
+    "{}: Everything You Need to Know",
+    "The Ultimate {} Tutorial",
+    "{} Explained in 10 Minutes",
+    "Top 5 {} Tips That Work"
+)
+
+_YOUTUBE_MAIN_POINT_FMTS = (
+    "What is {} and why it matters",
+    "Step-by-step process for {}",
+    "Pro tips for mastering {}",
+    "Common mistakes to avoid",
+    "Real results you can expect"
+)
+
+_YOUTUBE_METADATA_REQUIREMENTS = {
+    "title": "60 characters max, keyword at start",
+    "description": "First 150 chars most important, include timestamps",
+    "tags": "10-15 relevant tags",
+    "thumbnail": "1280x720px, faces + text"
+}
+
+_TIKTOK_STRUCTURE = {
+    "hook": {
+        "duration": "0-3 seconds",
+        "purpose": "Stop the scroll",
+        "elements": ["Visual surprise", "Bold statement"]
+    },
+    "content": {
+        "duration": "15-45 seconds",
+        "purpose": "Deliver quick value",
+        "elements": ["One clear point", "Visual demonstration"]
+    },
+    "cta": {
+        "duration": "2-5 seconds",
+        "purpose": "Engagement",
+        "elements": ["Follow", "Save", "Comment prompt"]
+    }
+}
+
+_TIKTOK_HOOK_FMTS = (
+    "POV: You just discovered the secret to {}",
+    "Wait until you see this {} hack",
+    "3 {} mistakes you're probably making",
+    "This {} tip changed everything",
+    "Nobody talks about this {} trick"
+)
+
+_TIKTOK_CONTENT_BEATS = [
+    {"second": 0, "action": "Visual hook", "text": "Bold text"},
+    {"second": 3, "action": "Problem", "text": "Relatable scenario"},
+    {"second": 10, "action": "Solution", "text": "Show method"},
+    {"second": 20, "action": "Demo", "text": "Quick results"},
+    {"second": 28, "action": "CTA", "text": "Follow for part 2"}
+]
+
+_TIKTOK_METADATA_REQUIREMENTS = {
+    "caption": "150 characters, hook in first line",
+    "hashtags": "3-5 relevant + trending",
+    "format": "Vertical 9:16, 1080x1920px"
+}
+
+_BLOG_STRUCTURE = {
+    "headline": {
+        "purpose": "SEO + Click appeal",
+        "elements": ["Target keyword", "Benefit statement"]
+    },
+    "introduction": {
+        "length": "100-150 words",
+        "purpose": "Hook reader",
+        "elements": ["Problem", "Promise", "Preview"]
+    },
+    "body": {
+        "length": "1500-2500 words",
+        "purpose": "Comprehensive info",
+        "elements": ["H2 subheadings", "Short paragraphs", "Bullet points"]
+    },
+    "conclusion": {
+        "length": "100-200 words",
+        "purpose": "Summary + CTA",
+        "elements": ["Key takeaways", "Next steps"]
+    }
+}
+
+_BLOG_HEADLINE_FMTS = (
+    "The Complete Guide to {} [2025]",
+    "{}: 7 Proven Strategies",
+    "How to Master {} (Even as a Beginner)",
+    "{} vs Alternatives: Which Is Best?",
+    "The Ultimate {} Checklist"
+)
+
+_BLOG_SECTION_FMTS = (
+    ("What is {}?", "Define clearly"),
+    ("Why {} Matters", "Benefits + stats"),
+    ("How to Get Started", "Step-by-step"),
+    ("Common Mistakes", "Pitfalls + solutions"),
+    ("Best Practices", "Pro tips"),
+    ("Conclusion", "Summary + action plan")
+)
+
+_BLOG_METADATA_REQUIREMENTS = {
+    "meta_title": "55-60 characters",
+    "meta_description": "150-160 characters",
+    "featured_image": "1200x630px"
+}
+
+_INSTAGRAM_STRUCTURE = {
+    "image": "Square 1080x1080px or Story 1080x1920px",
+    "caption": "First 125 chars visible, hook essential",
+    "hashtags": "Mix of popular and niche (10-30 tags)"
+}
+
+_INSTAGRAM_CAPTION_FMTS = (
+    "5 {} tips you need to know 👇",
+    "The truth about {} that nobody tells you...",
+    "How I mastered {} in 30 days",
+    "Your {} questions answered"
+)
+
+_REDDIT_STRUCTURE = {
+    "title": "Authentic, value-first approach",
+    "body": "Detailed, helpful response",
+    "tone": "Conversational, not promotional"
+}
+
+_REDDIT_TITLE_FMTS = (
+    "My experience with {} - what worked",
+    "Asked to share my {} journey",
+    "Common {} questions answered",
+    "{} resources that helped me"
+)
+
+_CREATION_TIME_ESTIMATES = {
+    "youtube": "4-8 hours (filming + editing)",
+    "tiktok": "30-60 minutes (quick edit)",
+    "blog": "3-5 hours (research + writing)",
+    "instagram": "1-2 hours (design + caption)",
+    "reddit": "30-45 minutes (authentic response)"
+}
+
+
 class TemplateGenerator:
     """Generate platform-specific content templates"""
 
@@ -33,211 +199,77 @@ class TemplateGenerator:
         """
         Generate customized content template for platform
 
+        Templates are pure functions of their inputs and are cached; each call
+        gets its own top-level dict and metadata dict, but the nested
+        structure is shared and must be treated as read-only.
+
         Returns complete content template with structure and suggestions
         """
-        try:
-            if platform == "youtube":
-                template = self._get_youtube_template(keyword, intent)
-            elif platform == "tiktok":
-                template = self._get_tiktok_template(keyword, intent)
-            elif platform == "blog":
-                template = self._get_blog_template(keyword, intent)
-            elif platform == "instagram":
-                template = self._get_instagram_template(keyword, intent)
-            elif platform == "reddit":
-                template = self._get_reddit_template(keyword, intent)
-            else:
-                template = self._get_generic_template(platform, keyword, intent)
-
-            # Add metadata
-            template["metadata"] = {
-                "keyword": keyword,
-                "intent": intent,
-                "platform": platform,
-                "content_type": content_type or "standard",
-                "estimated_creation_time": self._estimate_creation_time(platform)
-            }
-
-            return template
+        return _copy_template(_build_template(platform, keyword, intent, content_type))
 
-        except Exception as e:
-            logger.error(f"Template generation error: {str(e)}")
-            raise
-
-    def _get_youtube_template(self, keyword: str, intent: str) -> Dict:
+    @staticmethod
+    def _get_youtube_template(keyword: str, intent: str) -> Dict:
         """YouTube video template"""
         return {
             "platform": "youtube",
-            "structure": {
-                "intro": {
-                    "duration": "0-15 seconds",
-                    "purpose": "Hook viewer attention",
-                    "elements": ["Problem statement", "Promise of solution"]
-                },
-                "main_content": {
-                    "duration": "5-15 minutes",
-                    "purpose": "Deliver value",
-                    "elements": ["Main points (3-5)", "Examples", "Visual aids"]
-                },
-                "conclusion": {
-                    "duration": "30-60 seconds",
-                    "purpose": "Call to action",
-                    "elements": ["Summary", "CTA (subscribe/like/comment)"]
-                }
-            },
-            "title_suggestions": [
-                f"How to {keyword} (Complete Guide)",
-                f"{keyword}: Everything You Need to Know",
-                f"The Ultimate {keyword} Tutorial",
-                f"{keyword} Explained in 10 Minutes",
-                f"Top 5 {keyword} Tips That Work"
-            ],
+            "structure": _YOUTUBE_STRUCTURE,
+            "title_suggestions": [fmt.format(keyword) for fmt in _YOUTUBE_TITLE_FMTS],
             "script_outline": {
                 "hook": f"Are you struggling with {keyword}? In this video, I'll show you...",
-                "main_points": [
-                    f"What is {keyword} and why it matters",
-                    f"Step-by-step process for {keyword}",
-                    f"Pro tips for mastering {keyword}",
-                    f"Common mistakes to avoid",
-                    f"Real results you can expect"
-                ],
+                "main_points": [fmt.format(keyword) for fmt in _YOUTUBE_MAIN_POINT_FMTS],
                 "cta": f"If you found this {keyword} tutorial helpful, subscribe!"
             },
-            "metadata_requirements": {
-                "title": "60 characters max, keyword at start",
-                "description": "First 150 chars most important, include timestamps",
-                "tags": "10-15 relevant tags",
-                "thumbnail": "1280x720px, faces + text"
-            }
+            "metadata_requirements": _YOUTUBE_METADATA_REQUIREMENTS
         }
 
-    def _get_tiktok_template(self, keyword: str, intent: str) -> Dict:
+    @staticmethod
+    def _get_tiktok_template(keyword: str, intent: str) -> Dict:
         """TikTok short-form video template"""
         return {
             "platform": "tiktok",
-            "structure": {
-                "hook": {
-                    "duration": "0-3 seconds",
-                    "purpose": "Stop the scroll",
-                    "elements": ["Visual surprise", "Bold statement"]
-                },
-                "content": {
-                    "duration": "15-45 seconds",
-                    "purpose": "Deliver quick value",
-                    "elements": ["One clear point", "Visual demonstration"]
-                },
-                "cta": {
-                    "duration": "2-5 seconds",
-                    "purpose": "Engagement",
-                    "elements": ["Follow", "Save", "Comment prompt"]
-                }
-            },
-            "hook_variations": [
-                f"POV: You just discovered the secret to {keyword}",
-                f"Wait until you see this {keyword} hack",
-                f"3 {keyword} mistakes you're probably making",
-                f"This {keyword} tip changed everything",
-                f"Nobody talks about this {keyword} trick"
-            ],
-            "content_beats": [
-                {"second": 0, "action": "Visual hook", "text": "Bold text"},
-                {"second": 3, "action": "Problem", "text": "Relatable scenario"},
-                {"second": 10, "action": "Solution", "text": "Show method"},
-                {"second": 20, "action": "Demo", "text": "Quick results"},
-                {"second": 28, "action": "CTA", "text": "Follow for part 2"}
-            ],
-            "metadata_requirements": {
-                "caption": "150 characters, hook in first line",
-                "hashtags": "3-5 relevant + trending",
-                "format": "Vertical 9:16, 1080x1920px"
-            }
+            "structure": _TIKTOK_STRUCTURE,
+            "hook_variations": [fmt.format(keyword) for fmt in _TIKTOK_HOOK_FMTS],
+            "content_beats": _TIKTOK_CONTENT_BEATS,
+            "metadata_requirements": _TIKTOK_METADATA_REQUIREMENTS
         }
 
-    def _get_blog_template(self, keyword: str, intent: str) -> Dict:
+    @staticmethod
+    def _get_blog_template(keyword: str, intent: str) -> Dict:
         """Blog/article template"""
         return {
             "platform": "blog",
-            "structure": {
-                "headline": {
-                    "purpose": "SEO + Click appeal",
-                    "elements": ["Target keyword", "Benefit statement"]
-                },
-                "introduction": {
-                    "length": "100-150 words",
-                    "purpose": "Hook reader",
-                    "elements": ["Problem", "Promise", "Preview"]
-                },
-                "body": {
-                    "length": "1500-2500 words",
-                    "purpose": "Comprehensive info",
-                    "elements": ["H2 subheadings", "Short paragraphs", "Bullet points"]
-                },
-                "conclusion": {
-                    "length": "100-200 words",
-                    "purpose": "Summary + CTA",
-                    "elements": ["Key takeaways", "Next steps"]
-                }
-            },
-            "headline_formulas": [
-                f"The Complete Guide to {keyword} [2025]",
-                f"{keyword}: 7 Proven Strategies",
-                f"How to Master {keyword} (Even as a Beginner)",
-                f"{keyword} vs Alternatives: Which Is Best?",
-                f"The Ultimate {keyword} Checklist"
-            ],
+            "structure": _BLOG_STRUCTURE,
+            "headline_formulas": [fmt.format(keyword) for fmt in _BLOG_HEADLINE_FMTS],
             "content_outline": {
                 "h1": f"The Complete Guide to {keyword}",
                 "sections": [
-                    {"h2": f"What is {keyword}?", "content": "Define clearly"},
-                    {"h2": f"Why {keyword} Matters", "content": "Benefits + stats"},
-                    {"h2": f"How to Get Started", "content": "Step-by-step"},
-                    {"h2": f"Common Mistakes", "content": "Pitfalls + solutions"},
-                    {"h2": f"Best Practices", "content": "Pro tips"},
-                    {"h2": "Conclusion", "content": "Summary + action plan"}
+                    {"h2": h2_fmt.format(keyword), "content": content}
+                    for h2_fmt, content in _BLOG_SECTION_FMTS
                 ]
             },
-            "metadata_requirements": {
-                "meta_title": "55-60 characters",
-                "meta_description": "150-160 characters",
-                "featured_image": "1200x630px"
-            }
+            "metadata_requirements": _BLOG_METADATA_REQUIREMENTS
         }
 
-    def _get_instagram_template(self, keyword: str, intent: str) -> Dict:
+    @staticmethod
+    def _get_instagram_template(keyword: str, intent: str) -> Dict:
         """Instagram post template"""
         return {
             "platform": "instagram",
-            "structure": {
-                "image": "Square 1080x1080px or Story 1080x1920px",
-                "caption": "First 125 chars visible, hook essential",
-                "hashtags": "Mix of popular and niche (10-30 tags)"
-            },
-            "caption_formulas": [
-                f"5 {keyword} tips you need to know 👇",
-                f"The truth about {keyword} that nobody tells you...",
-                f"How I mastered {keyword} in 30 days",
-                f"Your {keyword} questions answered"
-            ]
+            "structure": _INSTAGRAM_STRUCTURE,
+            "caption_formulas": [fmt.format(keyword) for fmt in _INSTAGRAM_CAPTION_FMTS]
         }
 
-    def _get_reddit_template(self, keyword: str, intent: str) -> Dict:
+    @staticmethod
+    def _get_reddit_template(keyword: str, intent: str) -> Dict:
         """Reddit post template"""
         return {
             "platform": "reddit",
-            "structure": {
-                "title": "Authentic, value-first approach",
-                "body": "Detailed, helpful response",
-                "tone": "Conversational, not promotional"
-            },
-            "title_examples": [
-                f"My experience with {keyword} - what worked",
-                f"Asked to share my {keyword} journey",
-                f"Common {keyword} questions answered",
-                f"{keyword} resources that helped me"
-            ]
+            "structure": _REDDIT_STRUCTURE,
+            "title_examples": [fmt.format(keyword) for fmt in _REDDIT_TITLE_FMTS]
         }
 
-    def _get_generic_template(self, platform: str, keyword: str, intent: str) -> Dict:
+    @staticmethod
+    def _get_generic_template(platform: str, keyword: str, intent: str) -> Dict:
         """Generic template fallback"""
         return {
             "platform": platform,
@@ -247,16 +279,10 @@ class TemplateGenerator:
             "recommendation": "Research platform-specific guidelines"
         }
 
-    def _estimate_creation_time(self, platform: str) -> str:
+    @staticmethod
+    def _estimate_creation_time(platform: str) -> str:
         """Estimate content creation time"""
-        time_estimates = {
-            "youtube": "4-8 hours (filming + editing)",
-            "tiktok": "30-60 minutes (quick edit)",
-            "blog": "3-5 hours (research + writing)",
-            "instagram": "1-2 hours (design + caption)",
-            "reddit": "30-45 minutes (authentic response)"
-        }
-        return time_estimates.get(platform, "2-4 hours")
+        return _CREATION_TIME_ESTIMATES.get(platform, "2-4 hours")
 
     def batch_generate_templates(
         self,
@@ -265,12 +291,59 @@ class TemplateGenerator:
         """Generate templates for entire content plan"""
         templates = []
 
-        for item in content_plan:
-            template = self.generate_content_template(
-                platform=item["platform"],
-                keyword=item["keyword"],
-                intent=item.get("intent", "research")
-            )
-            templates.append(template)
+        item = None
+        try:
+            for item in content_plan:
+                template = self.generate_content_template(
+                    platform=item["platform"],
+                    keyword=item["keyword"],
+                    intent=item.get("intent", "research")
+                )
+                templates.append(template)
+        except Exception as e:
+            logger.error("Template generation error for plan item %r: %s", item, e)
+            raise
 
         return templates
+
+
+_PLATFORM_BUILDERS = {
+    "youtube": TemplateGenerator._get_youtube_template,
+    "tiktok": TemplateGenerator._get_tiktok_template,
+    "blog": TemplateGenerator._get_blog_template,
+    "instagram": TemplateGenerator._get_instagram_template,
+    "reddit": TemplateGenerator._get_reddit_template
+}
+
+
+@lru_cache(maxsize=1024)
+def _build_template(
+    platform: str,
+    keyword: str,
+    intent: str,
+    content_type: Optional[str] = None
+) -> Dict:
+    """Build a template for platform; cached, so the result is shared and read-only"""
+    get_template = _PLATFORM_BUILDERS.get(platform)
+    if get_template is not None:
+        template = get_template(keyword, intent)
+    else:
+        template = TemplateGenerator._get_generic_template(platform, keyword, intent)
+
+    # Add metadata
+    template["metadata"] = {
+        "keyword": keyword,
+        "intent": intent,
+        "platform": platform,
+        "content_type": content_type or "standard",
+        "estimated_creation_time": TemplateGenerator._estimate_creation_time(platform)
+    }
+
+    return template
+
+
+def _copy_template(template: Dict) -> Dict:
+    """Give the caller its own top-level and metadata dicts over a shared template"""
+    template = dict(template)
+    template["metadata"] = dict(template["metadata"])
+    return template
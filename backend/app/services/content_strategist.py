@@ -4,11 +4,16 @@ Uses OpenAI GPT-4 to create actionable content plans
 """
 
 from typing import List, Dict, Any
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from itertools import islice
+import hashlib
 import json
 import os
 import logging
-from openai import OpenAI
+import time
+import fastjsonschema
+from openai import AsyncOpenAI
 
 from app.models.keyword import KeywordData
 from app.models.cluster import KeywordCluster
@@ -22,8 +27,162 @@ from app.models.content_strategy import (
     ContentStatus
 )
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Value -> member lookups for enums parsed from model output; unknown values
+# fall back to a default instead of failing the whole strategy
+_PRIORITIES = {p.value: p for p in Priority}
+_DIFFICULTIES = {d.value: d for d in Difficulty}
+_CONTENT_TYPES = {t.value: t for t in ContentType}
+
+# Expected shape of the GPT-4 strategy JSON. Validation fills the defaults in
+# place, so parsing can index optional fields directly; scalar types are left
+# to the pydantic models, which coerce them
+_STRATEGY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "pillars": {
+            "type": "array",
+            "default": [],
+            "items": {
+                "type": "object",
+                "required": ["name", "description"],
+                "properties": {
+                    "keywords": {"type": "array", "default": []},
+                    "priority": {"default": "medium"},
+                    "total_opportunity": {"default": 0}
+                }
+            }
+        },
+        "content_items": {
+            "type": "array",
+            "default": [],
+            "items": {
+                "type": "object",
+                "required": ["title", "pillar", "target_keyword"],
+                "properties": {
+                    "content_type": {"default": "blog_post"},
+                    "supporting_keywords": {"type": "array", "default": []},
+                    "priority": {"default": "medium"},
+                    "estimated_difficulty": {"default": "medium"},
+                    "estimated_hours": {"default": 4},
+                    "week_number": {"default": 1},
+                    "optimization_tips": {"type": "array", "default": []}
+                }
+            }
+        },
+        "quick_wins": {"type": "array", "default": []},
+        "implementation_notes": {"default": ""},
+        "success_metrics": {"type": "array", "default": []}
+    }
+}
+
+_validate_strategy = fastjsonschema.compile(_STRATEGY_SCHEMA)
+
+_FALLBACK_OPTIMIZATION_TIPS = ["Include target keyword in title", "Use long-form content (2000+ words)"]
+
+# In-process cache of parsed GPT-4 strategies keyed by prompt digest, so
+# retries with identical inputs skip the API call entirely
+_STRATEGY_CACHE_TTL = 24 * 60 * 60
+_STRATEGY_CACHE_MAX = 256
+_strategy_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _get_cached_strategy(key: str):
+    """Return cached strategy data for key, or None if missing/expired"""
+    entry = _strategy_cache.get(key)
+    if entry is None:
+        return None
+
+    stored_at, strategy_data = entry
+    if time.monotonic() - stored_at > _STRATEGY_CACHE_TTL:
+        del _strategy_cache[key]
+        return None
+
+    _strategy_cache.move_to_end(key)
+    return strategy_data
+
+
+def _cache_strategy(key: str, strategy_data: Dict[str, Any]) -> None:
+    """Store strategy data, evicting the least recently used entry when full"""
+    _strategy_cache[key] = (time.monotonic(), strategy_data)
+    _strategy_cache.move_to_end(key)
+    if len(_strategy_cache) > _STRATEGY_CACHE_MAX:
+        _strategy_cache.popitem(last=False)
+
+
+_SYSTEM_MSG = """You are an expert SEO content strategist.
+                        Generate comprehensive, actionable content strategies based on keyword research data.
+                        Focus on practical implementation, content pillar architecture, and realistic timelines.
+                        Always return valid JSON."""
+
+# Strategy prompt, filled with str.format_map (literal JSON braces are doubled)
+_PROMPT_TEMPLATE = """
+Generate a comprehensive content strategy for: "{seed_keyword}"
+
+NICHE ANALYSIS:
+- Market Size: {market_size}
+- Competition Level: {competition}
+- Target Timeline: {timeline} weeks
+
+KEYWORD CLUSTERS:
+{cluster_summary}
+
+TOP KEYWORD OPPORTUNITIES:
+{opportunity_summary}
+
+CONTENT GAPS IDENTIFIED:
+{gaps_summary}
+
+REQUIREMENTS:
+1. Create 3-5 content pillars based on keyword clusters
+2. For each pillar, generate 8-12 specific content topics
+3. Assign priority (high/medium/low) to each topic
+4. Suggest content type (blog_post, guide, video, infographic, etc.)
+5. Estimate difficulty and timeframe for each piece
+6. Create a realistic {timeline}-week editorial calendar
+7. Include quick wins (easy topics to start with)
+8. Provide SEO optimization tips for each pillar
+
+CONTENT TYPES AVAILABLE: {content_types}
+
+Return response as JSON with this structure:
+{{
+  "pillars": [
+    {{
+      "name": "Pillar name",
+      "description": "What this pillar covers",
+      "keywords": ["keyword1", "keyword2"],
+      "priority": "high",
+      "total_opportunity": 50000
+    }}
+  ],
+  "content_items": [
+    {{
+      "title": "Content title",
+      "pillar": "Pillar name",
+      "content_type": "blog_post",
+      "target_keyword": "main keyword",
+      "supporting_keywords": ["keyword1", "keyword2"],
+      "priority": "high",
+      "estimated_difficulty": "medium",
+      "estimated_hours": 8,
+      "week_number": 1,
+      "optimization_tips": ["tip1", "tip2"]
+    }}
+  ],
+  "quick_wins": ["Quick win topic 1", "Quick win topic 2"],
+  "implementation_notes": "Key recommendations for execution",
+  "success_metrics": ["Metric 1", "Metric 2"]
+}}
+"""
+
 
 class ContentStrategist:
     """Generate comprehensive content strategies from keyword data"""
@@ -32,7 +191,7 @@ class ContentStrategist:
         api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError("OpenAI API key is required")
-        self.client = OpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key)
 
     async def generate_strategy(
         self,
@@ -55,7 +214,7 @@ class ContentStrategist:
         Returns:
             ContentStrategy with pillars, topics, and calendar
         """
-        logger.info(f"Generating content strategy for '{seed_keyword}'")
+        logger.info("Generating content strategy for '%s'", seed_keyword)
 
         # Default options
         if options is None:
@@ -65,39 +224,44 @@ class ContentStrategist:
         prompt = self._build_strategy_prompt(
             seed_keyword=seed_keyword,
             clusters=clusters,
-            opportunities=opportunities[:20],  # Top 20 only
+            opportunities=opportunities,  # Prompt only reads the top entries
             content_gaps=niche_analysis.get('content_gaps', []),
             market_size=niche_analysis.get('market_size', 'medium'),
             competition=niche_analysis.get('competition_level', 'medium'),
             options=options
         )
 
-        # Generate strategy with GPT-4
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are an expert SEO content strategist.
-                        Generate comprehensive, actionable content strategies based on keyword research data.
-                        Focus on practical implementation, content pillar architecture, and realistic timelines.
-                        Always return valid JSON."""
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7,
-                max_tokens=3000
-            )
-
-            strategy_data = json.loads(response.choices[0].message.content)
-            logger.info("AI strategy generated successfully")
-
-        except Exception as e:
-            logger.error(f"Error generating strategy with OpenAI: {e}")
-            # Fallback to template strategy
-            strategy_data = self._generate_fallback_strategy(seed_keyword, clusters, opportunities)
+        # Reuse a previous GPT-4 strategy for an identical prompt
+        cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        strategy_data = _get_cached_strategy(cache_key)
+
+        if strategy_data is not None:
+            logger.info("Using cached AI strategy")
+        else:
+            # Generate strategy with GPT-4
+            try:
+                response = await self.client.chat.completions.create(
+                    model="gpt-4-turbo-preview",
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_MSG},
+                        {"role": "user", "content": prompt}
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.7,
+                    max_tokens=3000
+                )
+
+                strategy_data = _json_loads(response.choices[0].message.content)
+                _validate_strategy(strategy_data)
+                logger.info("AI strategy generated successfully")
+
+                # Only real AI responses are cached, never the fallback
+                _cache_strategy(cache_key, strategy_data)
+
+            except Exception as e:
+                logger.error("Error generating strategy with OpenAI: %s", e)
+                # Fallback to template strategy
+                strategy_data = self._generate_fallback_strategy(seed_keyword, clusters, opportunities)
 
         # Transform to ContentStrategy model
         strategy = self._parse_strategy_response(
@@ -107,7 +271,10 @@ class ContentStrategist:
             opportunities=opportunities
         )
 
-        logger.info(f"Strategy created with {len(strategy.pillars)} pillars and {len(strategy.content_items)} items")
+        logger.info(
+            "Strategy created with %d pillars and %d items",
+            len(strategy.pillars), len(strategy.content_items)
+        )
         return strategy
 
     def _build_strategy_prompt(
@@ -122,87 +289,39 @@ class ContentStrategist:
     ) -> str:
         """Build detailed prompt for GPT-4"""
 
+        get = dict.get
+
         # Format clusters
-        cluster_summary = "\n".join([
+        cluster_summary = "\n".join(
             f"- {c.cluster_name} ({c.total_keywords} keywords, {c.total_search_volume:,} total volume)"
-            for c in clusters[:10]  # Top 10 clusters
-        ])
+            for c in islice(clusters, 10)  # Top 10 clusters
+        )
 
         # Format top opportunities
-        opportunity_summary = "\n".join([
-            f"- {o.get('keyword', '')} (Vol: {o.get('search_volume', 0):,}, Diff: {o.get('keyword_difficulty', 0)}, Score: {o.get('opportunity_score', 0):.1f})"
-            for o in opportunities[:15]
-        ])
+        opportunity_summary = "\n".join(
+            f"- {get(o, 'keyword', '')} (Vol: {get(o, 'search_volume', 0):,}, Diff: {get(o, 'keyword_difficulty', 0)}, Score: {get(o, 'opportunity_score', 0):.1f})"
+            for o in islice(opportunities, 15)
+        )
 
         # Format content gaps
-        gaps_summary = "\n".join([
-            f"- {gap.get('gap_type', '')}: {gap.get('description', '')}"
-            for gap in content_gaps[:5]
-        ])
+        gaps_summary = "\n".join(
+            f"- {get(gap, 'gap_type', '')}: {get(gap, 'description', '')}"
+            for gap in islice(content_gaps, 5)
+        )
 
         timeline = options.get('timeline_weeks', 12)
         content_types = options.get('content_types', ['blog_post', 'guide', 'video'])
 
-        prompt = f"""
-Generate a comprehensive content strategy for: "{seed_keyword}"
-
-NICHE ANALYSIS:
-- Market Size: {market_size}
-- Competition Level: {competition}
-- Target Timeline: {timeline} weeks
-
-KEYWORD CLUSTERS:
-{cluster_summary}
-
-TOP KEYWORD OPPORTUNITIES:
-{opportunity_summary}
-
-CONTENT GAPS IDENTIFIED:
-{gaps_summary}
-
-REQUIREMENTS:
-1. Create 3-5 content pillars based on keyword clusters
-2. For each pillar, generate 8-12 specific content topics
-3. Assign priority (high/medium/low) to each topic
-4. Suggest content type (blog_post, guide, video, infographic, etc.)
-5. Estimate difficulty and timeframe for each piece
-6. Create a realistic {timeline}-week editorial calendar
-7. Include quick wins (easy topics to start with)
-8. Provide SEO optimization tips for each pillar
-
-CONTENT TYPES AVAILABLE: {', '.join(content_types)}
-
-Return response as JSON with this structure:
-{{
-  "pillars": [
-    {{
-      "name": "Pillar name",
-      "description": "What this pillar covers",
-      "keywords": ["keyword1", "keyword2"],
-      "priority": "high",
-      "total_opportunity": 50000
-    }}
-  ],
-  "content_items": [
-    {{
-      "title": "Content title",
-      "pillar": "Pillar name",
-      "content_type": "blog_post",
-      "target_keyword": "main keyword",
-      "supporting_keywords": ["keyword1", "keyword2"],
-      "priority": "high",
-      "estimated_difficulty": "medium",
-      "estimated_hours": 8,
-      "week_number": 1,
-      "optimization_tips": ["tip1", "tip2"]
-    }}
-  ],
-  "quick_wins": ["Quick win topic 1", "Quick win topic 2"],
-  "implementation_notes": "Key recommendations for execution",
-  "success_metrics": ["Metric 1", "Metric 2"]
-}}
-"""
-        return prompt
+        return _PROMPT_TEMPLATE.format_map({
+            "seed_keyword": seed_keyword,
+            "market_size": market_size,
+            "competition": competition,
+            "timeline": timeline,
+            "cluster_summary": cluster_summary,
+            "opportunity_summary": opportunity_summary,
+            "gaps_summary": gaps_summary,
+            "content_types": ', '.join(content_types)
+        })
 
     def _generate_fallback_strategy(
         self,
@@ -214,7 +333,7 @@ Return response as JSON with this structure:
         logger.info("Using fallback strategy generation")
 
         pillars = []
-        for i, cluster in enumerate(clusters[:4]):
+        for i, cluster in enumerate(islice(clusters, 4)):
             pillars.append({
                 "name": cluster.cluster_name,
                 "description": cluster.theme.description,
@@ -223,28 +342,30 @@ Return response as JSON with this structure:
                 "total_opportunity": cluster.total_search_volume
             })
 
-        content_items = []
-        for i, opp in enumerate(opportunities[:20]):
-            week = (i // 2) + 1
-            pillar_name = pillars[i % len(pillars)]["name"] if pillars else "Content"
+        # Items rotate through the pillars (or a single generic one)
+        pillar_names = [p["name"] for p in pillars] or ["Content"]
+        n = len(pillar_names)
 
-            content_items.append({
+        content_items = [
+            {
                 "title": f"Guide to {opp.get('keyword', '')}",
-                "pillar": pillar_name,
+                "pillar": pillar_names[i % n],
                 "content_type": "blog_post",
                 "target_keyword": opp.get('keyword', ''),
                 "supporting_keywords": [],
                 "priority": "high" if i < 5 else "medium",
                 "estimated_difficulty": "medium",
                 "estimated_hours": 6,
-                "week_number": week,
-                "optimization_tips": ["Include target keyword in title", "Use long-form content (2000+ words)"]
-            })
+                "week_number": (i // 2) + 1,
+                "optimization_tips": _FALLBACK_OPTIMIZATION_TIPS
+            }
+            for i, opp in enumerate(islice(opportunities, 20))
+        ]
 
         return {
             "pillars": pillars,
             "content_items": content_items,
-            "quick_wins": [item["title"] for item in content_items[:3]],
+            "quick_wins": [item["title"] for item in islice(content_items, 3)],
             "implementation_notes": "Focus on high-priority content first, build authority gradually",
             "success_metrics": ["Organic traffic growth", "Keyword rankings", "Conversion rate"]
         }
@@ -256,7 +377,17 @@ Return response as JSON with this structure:
         clusters: List[KeywordCluster],
         opportunities: List[Dict[str, Any]]
     ) -> ContentStrategy:
-        """Transform AI response to ContentStrategy model"""
+        """
+        Transform AI response to ContentStrategy model
+
+        strategy_data must match _STRATEGY_SCHEMA with defaults filled in
+        (validated AI output, or the fallback strategy which is built complete)
+        """
+
+        # Index cluster ids by name once instead of scanning clusters per pillar
+        cluster_ids_by_name = {}
+        for c in clusters:
+            cluster_ids_by_name.setdefault(c.cluster_name, []).append(c.cluster_id)
 
         # Create content pillars
         pillars = [
@@ -264,35 +395,46 @@ Return response as JSON with this structure:
                 id=f"pillar_{i}",
                 name=p['name'],
                 description=p['description'],
-                keywords=p.get('keywords', []),
-                priority=Priority(p.get('priority', 'medium')),
-                total_opportunity=p.get('total_opportunity', 0),
-                cluster_ids=[c.cluster_id for c in clusters if c.cluster_name == p['name']][:3]
+                keywords=p['keywords'],
+                priority=_PRIORITIES.get(p['priority'], Priority.MEDIUM),
+                total_opportunity=p['total_opportunity'],
+                cluster_ids=cluster_ids_by_name.get(p['name'], [])[:3]
             )
-            for i, p in enumerate(strategy_data.get('pillars', []))
+            for i, p in enumerate(strategy_data['pillars'])
         ]
 
         # Create content items
         start_date = datetime.now()
+        week_dates = {}  # week_number -> publish date, computed once per week
         items = []
-        for item_data in strategy_data.get('content_items', []):
-            week = item_data.get('week_number', 1)
-            publish_date = start_date + timedelta(weeks=week-1)
-
-            items.append(ContentItem(
+        total_hours = 0
+        max_week = None
+        for item_data in strategy_data['content_items']:
+            week = item_data['week_number']
+            publish_date = week_dates.get(week)
+            if publish_date is None:
+                publish_date = week_dates[week] = start_date + timedelta(weeks=week-1)
+
+            item = ContentItem(
                 id=f"item_{len(items)}",
                 title=item_data['title'],
                 pillar_name=item_data['pillar'],
-                content_type=ContentType(item_data.get('content_type', 'blog_post')),
+                content_type=_CONTENT_TYPES.get(item_data['content_type'], ContentType.BLOG_POST),
                 target_keyword=item_data['target_keyword'],
-                supporting_keywords=item_data.get('supporting_keywords', []),
-                priority=Priority(item_data.get('priority', 'medium')),
-                estimated_difficulty=Difficulty(item_data.get('estimated_difficulty', 'medium')),
-                estimated_hours=item_data.get('estimated_hours', 4),
+                supporting_keywords=item_data['supporting_keywords'],
+                priority=_PRIORITIES.get(item_data['priority'], Priority.MEDIUM),
+                estimated_difficulty=_DIFFICULTIES.get(item_data['estimated_difficulty'], Difficulty.MEDIUM),
+                estimated_hours=item_data['estimated_hours'],
                 scheduled_date=publish_date,
-                optimization_tips=item_data.get('optimization_tips', []),
+                optimization_tips=item_data['optimization_tips'],
                 status=ContentStatus.PLANNED
-            ))
+            )
+            items.append(item)
+
+            # Totals for the strategy summary, gathered in the same pass
+            total_hours += item.estimated_hours
+            if max_week is None or week > max_week:
+                max_week = week
 
         # Build strategy
         strategy = ContentStrategy(
@@ -300,12 +442,12 @@ Return response as JSON with this structure:
             generated_at=datetime.now(),
             pillars=pillars,
             content_items=items,
-            quick_wins=strategy_data.get('quick_wins', []),
-            implementation_notes=strategy_data.get('implementation_notes', ''),
-            success_metrics=strategy_data.get('success_metrics', []),
+            quick_wins=strategy_data['quick_wins'],
+            implementation_notes=strategy_data['implementation_notes'],
+            success_metrics=strategy_data['success_metrics'],
             total_pieces=len(items),
-            estimated_total_hours=sum(i.estimated_hours for i in items),
-            timeline_weeks=max([item_data.get('week_number', 1) for item_data in strategy_data.get('content_items', [])]) if strategy_data.get('content_items') else 12
+            estimated_total_hours=total_hours,
+            timeline_weeks=max_week if max_week is not None else 12
         )
 
         return strategy
@@ -5,19 +5,164 @@ Handles authentication, API requests, rate limiting, and error handling
 
 import os
 import asyncio
+import json
 import logging
-from typing import Dict, Any, Optional
+import random
+import time
+from collections import deque
+from enum import Enum
+from functools import lru_cache
+from typing import AsyncIterator, Deque, Dict, Any, List, Optional, Tuple
 import aiohttp
 import base64
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode()
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; task_get_stream falls back to task_get
+    ijson = None
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the host application (see main.py / app/main.py)
 logger = logging.getLogger(__name__)
 
+# DataForSEO accepts up to 100 tasks per POST request
+MAX_TASKS_PER_REQUEST = 100
+
+# Crawl options sent with every on_page/task_post task
+_TASK_POST_DEFAULTS = {
+    "load_resources": False,
+    "enable_javascript": True,
+    "enable_browser_rendering": False,
+    "store_raw_html": False
+}
+
+# Bytes of a failed response's body kept for the error message
+MAX_ERROR_BODY_BYTES = 2048
+
+# Bytes read per network read in task_get_stream
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# ijson prefix of the page records in an on_page/pages response
+_PAGE_ITEM_PREFIX = "tasks.item.result.item.items.item"
+
+
+class TaskState(Enum):
+    """Crawl task state reported by task_status / task_get"""
+    DONE = "done"
+    IN_QUEUE = "in_queue"
+    IN_PROGRESS = "in_progress"
+    ERROR = "error"
+
+
+# Set once an in-progress status message has been seen with a non-progress code
+_status_mismatch_warned = False
+
+
+def _task_state(task_data: Dict[str, Any]) -> TaskState:
+    """
+    Map a task entry's status to a TaskState
+    Status codes: 20000 = OK, 40100 = Task In Queue, 40300 = Task In Progress
+    """
+    status_code = task_data.get("status_code")
+
+    if status_code == 20000:
+        return TaskState.DONE
+    elif status_code == 40100:
+        return TaskState.IN_QUEUE
+    elif status_code == 40300:
+        return TaskState.IN_PROGRESS
+
+    # Error path only: flag (once) in-progress messages arriving with an unexpected code
+    global _status_mismatch_warned
+    if not _status_mismatch_warned:
+        status_msg = task_data.get("status_message", "")
+        if "Task In Queue" in status_msg or "Task In Progress" in status_msg:
+            _status_mismatch_warned = True
+            logger.warning(f"Status message '{status_msg}' arrived with status code {status_code}")
+    return TaskState.ERROR
+
+
+# Exception messages raised by the *_raise wrappers for in-progress tasks
+_IN_PROGRESS_MARKERS = {
+    TaskState.IN_QUEUE: "TASK_IN_QUEUE",
+    TaskState.IN_PROGRESS: "TASK_IN_PROGRESS",
+}
+
+
+@lru_cache(maxsize=8)
+def _basic_auth_header(login: str, password: str) -> str:
+    """Basic Auth header value; cached since routes build a client per request"""
+    credentials = f"{login}:{password}"
+    return f"Basic {base64.b64encode(credentials.encode()).decode()}"
+
+
+class _ConcurrencyLimiter:
+    """
+    Async context manager admitting at most `limit` holders at a time
+
+    Unlike asyncio.Semaphore the limit can change while slots are held or
+    awaited: after a decrease, no new holder is admitted until enough of the
+    current ones have left. Waiters are admitted in FIFO order.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def resize(self, limit: int):
+        """Change the limit, admitting waiters if it grew"""
+        self.limit = limit
+        self._wake()
+
+    async def __aenter__(self) -> "_ConcurrencyLimiter":
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return self
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the cancellation
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._release()
+
+    def _release(self):
+        self.active -= 1
+        self._wake()
+
+    def _wake(self):
+        """Hand free slots to the longest-waiting callers"""
+        while self._waiters and self.active < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
 
 class DataForSEOClient:
     """
@@ -36,11 +181,48 @@ class DataForSEOClient:
 
         # Create auth header
         self.auth_header = self._create_auth_header()
+        self._headers = {
+            "Authorization": self.auth_header,
+            "Content-Type": "application/json"
+        }
 
         # Configuration
         self.max_retries = 3
         self.timeout = 30
         self.retry_delay = 2  # seconds
+        self.max_delay = 30  # seconds
+        self.jitter = 0.5  # fraction of the delay added at random
+
+        # Shared HTTP session (created lazily, reused across requests);
+        # the timeout is a session default, so no per-call timeout objects
+        self._timeout = aiohttp.ClientTimeout(total=self.timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Sliding-window rate limit (requests per minute)
+        self._rpm_limit = int(os.getenv("DATAFORSEO_RPM", "2000"))
+        self._req_times: Deque[float] = deque()
+        self._rate_lock = asyncio.Lock()
+
+        # Cap on concurrent public API calls (caller fan-out), applied
+        # on top of the adaptive AIMD limit below
+        self._api_sem = asyncio.Semaphore(int(os.getenv("DATAFORSEO_CONCURRENCY", "16")))
+
+        # AIMD concurrency control: additive increase on fast successes,
+        # multiplicative decrease when the API signals overload
+        self._c = 8.0
+        self._c_min = 1
+        self._c_max = 64
+        self._latency_target = 5.0  # seconds
+        self._latency_avg: Optional[float] = None
+        self._limiter = _ConcurrencyLimiter(int(self._c))
+
+        # Short-lived tasks_ready cache shared by concurrent pollers
+        self.tasks_ready_ttl = 2.0  # seconds
+        self._tasks_ready_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._tasks_ready_lock = asyncio.Lock()
+
+        # In-flight task_status requests by task ID (single-flight)
+        self._inflight_status: Dict[str, asyncio.Future] = {}
 
         logger.info("DataForSEO client initialized")
 
@@ -49,25 +231,129 @@ class DataForSEOClient:
         Create Basic Auth header for DataForSEO API
         Returns: Authorization header value
         """
-        credentials = f"{self.login}:{self.password}"
-        b64_credentials = base64.b64encode(credentials.encode()).decode()
-        return f"Basic {b64_credentials}"
+        return _basic_auth_header(self.login, self.password)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff delay with random jitter, capped at max_delay
+        Jitter keeps concurrent clients from retrying in lockstep
+        """
+        delay = self.retry_delay * (2 ** attempt) * (1 + random.random() * self.jitter)
+        return min(self.max_delay, delay)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header given either as seconds or as an HTTP date
+        Returns: Delay in seconds, or None if missing/unparseable
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use
+        Keeps connections to DataForSEO alive between API calls
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                headers=self._headers,
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                # DataForSEO doesn't use cookies
+                cookie_jar=aiohttp.DummyCookieJar()
+            )
+        return self._session
+
+    async def _wait_if_throttled(self):
+        """
+        Block until another request fits in the per-minute rate window
+        Keeps the request rate under the API limit instead of reacting to 429s
+        """
+        async with self._rate_lock:
+            req_times = self._req_times
+            now = time.monotonic()
+            while req_times and req_times[0] <= now - 60:
+                req_times.popleft()
+            if len(req_times) >= self._rpm_limit:
+                wait = req_times[0] + 60 - now
+                logger.info(f"Request rate limit reached, waiting {wait:.1f}s")
+                await asyncio.sleep(wait)
+                req_times.popleft()
+            req_times.append(time.monotonic())
+
+    def _resize_limiter(self, new_c: float):
+        """
+        Apply a new concurrency level to the shared limiter
+        A decrease holds back new requests until in-flight ones drop below it
+        """
+        new_c = min(float(self._c_max), max(float(self._c_min), new_c))
+        old_size = int(self._c)
+        self._c = new_c
+        if int(new_c) != old_size:
+            self._limiter.resize(int(new_c))
+            logger.debug(f"DataForSEO concurrency adjusted {old_size} -> {int(new_c)}")
+
+    def _record_success(self, latency: float):
+        """Track rolling latency and additively raise concurrency while the API keeps up"""
+        if self._latency_avg is None:
+            self._latency_avg = latency
+        else:
+            self._latency_avg = 0.8 * self._latency_avg + 0.2 * latency
+        if self._latency_avg < self._latency_target:
+            self._resize_limiter(self._c + 0.5)
+
+    def _record_overload(self):
+        """Halve concurrency after a 429, 502/503 or timeout"""
+        self._resize_limiter(self._c * 0.5)
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "DataForSEOClient":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     async def _make_request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0
+        data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Make an async HTTP request to DataForSEO API with retries
 
+        Timeouts, connection errors, 429 and 5xx responses are retried up to
+        max_retries times with jittered exponential backoff (429 honors
+        Retry-After).
+
         Args:
             method: HTTP method (GET or POST)
             endpoint: API endpoint path
             data: Request payload for POST requests
-            retry_count: Current retry attempt number
 
         Returns:
             API response as dict
@@ -76,64 +362,111 @@ class DataForSEOClient:
             Exception: After max retries or on unrecoverable errors
         """
         url = f"{self.base_url}/{endpoint}"
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json"
-        }
+        method = method.upper()
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                timeout = aiohttp.ClientTimeout(total=self.timeout)
-
-                if method.upper() == "POST":
-                    async with session.post(
-                        url,
-                        json=data,
-                        headers=headers,
-                        timeout=timeout
-                    ) as response:
-                        return await self._handle_response(response, method, endpoint, data, retry_count)
-
-                elif method.upper() == "GET":
-                    async with session.get(
-                        url,
-                        headers=headers,
-                        timeout=timeout
-                    ) as response:
-                        return await self._handle_response(response, method, endpoint, data, retry_count)
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
 
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+        payload = _json_dumps(data) if data is not None else None
 
-        except asyncio.TimeoutError:
-            logger.error(f"Request timeout for {endpoint}")
-            if retry_count < self.max_retries:
-                return await self._retry_request(method, endpoint, data, retry_count)
-            raise Exception(f"Request timeout after {self.max_retries} retries")
-
-        except aiohttp.ClientError as e:
-            logger.error(f"Client error for {endpoint}: {str(e)}")
-            if retry_count < self.max_retries:
-                return await self._retry_request(method, endpoint, data, retry_count)
-            raise Exception(f"Client error after {self.max_retries} retries: {str(e)}")
-
-    async def _handle_response(
+        for attempt in range(self.max_retries + 1):
+            can_retry = attempt < self.max_retries
+            await self._wait_if_throttled()
+
+            try:
+                session = await self._get_session()
+
+                # Hold a concurrency slot only while the request is on the wire;
+                # the body is buffered so backoff and parsing happen outside it
+                async with self._limiter:
+                    started = time.monotonic()
+
+                    if method == "POST":
+                        response = await session.post(url, data=payload)
+                    else:
+                        response = await session.get(url)
+
+                    async with response:
+                        if response.status == 200:
+                            body = await response.read()
+                        else:
+                            # Error bodies only feed error messages; skip large HTML pages
+                            body = await response.content.read(MAX_ERROR_BODY_BYTES)
+
+            except asyncio.TimeoutError:
+                logger.error(f"Request timeout for {endpoint}")
+                self._record_overload()
+                if can_retry:
+                    await self._backoff(endpoint, attempt + 1, self._backoff_delay(attempt + 1))
+                    continue
+                raise Exception(f"Request timeout after {self.max_retries} retries")
+
+            except aiohttp.ClientError as e:
+                logger.error(f"Client error for {endpoint}: {str(e)}")
+                if can_retry:
+                    await self._backoff(endpoint, attempt + 1, self._backoff_delay(attempt + 1))
+                    continue
+                raise Exception(f"Client error after {self.max_retries} retries: {str(e)}")
+
+            status = response.status
+
+            if status in (429, 502, 503):
+                self._record_overload()
+            elif status == 200:
+                self._record_success(time.monotonic() - started)
+
+            # Handle rate limiting (429)
+            if status == 429:
+                logger.warning(f"Rate limited on {endpoint}, retry {attempt + 1}/{self.max_retries}")
+                if can_retry:
+                    # Prefer the server's hint so the next attempt lands after the quota resets
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        delay = min(retry_after, 60)
+                    else:
+                        delay = self._backoff_delay(attempt + 1)
+                    await self._backoff(endpoint, attempt + 1, delay)
+                    continue
+                raise Exception("Rate limit exceeded after max retries")
+
+            # Handle server errors with retry
+            if status >= 500:
+                logger.error(f"Server error {status} for {endpoint}")
+                if can_retry:
+                    await self._backoff(endpoint, attempt + 1, self._backoff_delay(attempt + 1))
+                    continue
+                raise Exception(f"Server error {status} after {self.max_retries} retries")
+
+            return self._handle_response(response, body, endpoint)
+
+    async def _api_request(
         self,
-        response: aiohttp.ClientResponse,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]],
-        retry_count: int
+        data: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """_make_request under the DATAFORSEO_CONCURRENCY cap used by the public API methods"""
+        async with self._api_sem:
+            return await self._make_request(method, endpoint, data)
+
+    async def _backoff(self, endpoint: str, attempt: int, delay: float):
+        """Log and sleep before retry number `attempt`"""
+        logger.info(f"Retrying request to {endpoint} after {delay:.1f}s (attempt {attempt}/{self.max_retries})")
+        await asyncio.sleep(delay)
+
+    def _handle_response(
+        self,
+        response: aiohttp.ClientResponse,
+        body: bytes,
+        endpoint: str
     ) -> Dict[str, Any]:
         """
-        Handle API response and check for errors
+        Check a non-retryable API response for errors and parse it
 
         Args:
             response: aiohttp response object
-            method: HTTP method used
+            body: Raw response body
             endpoint: API endpoint
-            data: Request data
-            retry_count: Current retry count
 
         Returns:
             Parsed JSON response
@@ -141,41 +474,29 @@ class DataForSEOClient:
         Raises:
             Exception: On error responses
         """
-        # Handle rate limiting (429)
-        if response.status == 429:
-            logger.warning(f"Rate limited on {endpoint}, retry {retry_count + 1}/{self.max_retries}")
-            if retry_count < self.max_retries:
-                await asyncio.sleep(self.retry_delay * (retry_count + 1))  # Exponential backoff
-                return await self._retry_request(method, endpoint, data, retry_count)
-            raise Exception("Rate limit exceeded after max retries")
-
         # Handle authentication errors
         if response.status == 401:
             raise Exception("Authentication failed - check DataForSEO credentials")
 
         # Handle other client errors
         if response.status >= 400 and response.status < 500:
-            error_text = await response.text()
+            error_text = body.decode("utf-8", "replace")
             raise Exception(f"Client error {response.status}: {error_text}")
 
-        # Handle server errors with retry
-        if response.status >= 500:
-            logger.error(f"Server error {response.status} for {endpoint}")
-            if retry_count < self.max_retries:
-                return await self._retry_request(method, endpoint, data, retry_count)
-            raise Exception(f"Server error {response.status} after {self.max_retries} retries")
-
         # Success - parse JSON
         if response.status == 200:
             try:
-                result = await response.json()
+                result = _json_loads(body)
 
                 # Check DataForSEO status code in response
-                if result.get("status_code") and result["status_code"] >= 40000:
-                    logger.error(f"DataForSEO API error: {result.get('status_message')}")
-                    raise Exception(f"DataForSEO error: {result.get('status_message')}")
-
-                logger.info(f"Request to {endpoint} successful, cost: ${result.get('cost', 0)}")
+                status_code = result.get("status_code")
+                if status_code and status_code >= 40000:
+                    status_msg = result.get("status_message")
+                    logger.error(f"DataForSEO API error: {status_msg}")
+                    raise Exception(f"DataForSEO error: {status_msg}")
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Request to {endpoint} successful, cost: ${result.get('cost', 0)}")
                 return result
 
             except Exception as e:
@@ -184,32 +505,31 @@ class DataForSEOClient:
 
         raise Exception(f"Unexpected status code: {response.status}")
 
-    async def _retry_request(
-        self,
-        method: str,
-        endpoint: str,
-        data: Optional[Dict[str, Any]],
-        retry_count: int
-    ) -> Dict[str, Any]:
-        """
-        Retry a failed request with exponential backoff
+    # ===== On-Page API Methods =====
 
-        Args:
-            method: HTTP method
-            endpoint: API endpoint
-            data: Request data
-            retry_count: Current retry count
+    @staticmethod
+    def _task_post_item(target_url: str, max_crawl_pages: int = 100) -> Dict[str, Any]:
+        """Build one task entry for the on_page/task_post payload"""
+        return {"target": target_url, "max_crawl_pages": max_crawl_pages, **_TASK_POST_DEFAULTS}
 
-        Returns:
-            API response
+    async def _post_in_chunks(self, endpoint: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        retry_count += 1
-        delay = self.retry_delay * retry_count
-        logger.info(f"Retrying request to {endpoint} after {delay}s (attempt {retry_count}/{self.max_retries})")
-        await asyncio.sleep(delay)
-        return await self._make_request(method, endpoint, data, retry_count)
+        POST items in chunks of MAX_TASKS_PER_REQUEST and collect the task entries
 
-    # ===== On-Page API Methods =====
+        Returns:
+            Task entries from all responses, in the same order as items
+        """
+        chunks = [
+            items[i:i + MAX_TASKS_PER_REQUEST]
+            for i in range(0, len(items), MAX_TASKS_PER_REQUEST)
+        ]
+        results = await asyncio.gather(
+            *(self._api_request("POST", endpoint, chunk) for chunk in chunks)
+        )
+        tasks: List[Dict[str, Any]] = []
+        for result in results:
+            tasks.extend(result.get("tasks") or [])
+        return tasks
 
     async def task_post(self, target_url: str, max_crawl_pages: int = 100) -> Dict[str, Any]:
         """
@@ -233,19 +553,12 @@ class DataForSEOClient:
         """
         endpoint = "on_page/task_post"
 
-        payload = [{
-            "target": target_url,
-            "max_crawl_pages": max_crawl_pages,
-            "load_resources": False,
-            "enable_javascript": True,
-            "enable_browser_rendering": False,
-            "store_raw_html": False
-        }]
+        payload = [self._task_post_item(target_url, max_crawl_pages)]
 
         logger.info(f"Initiating crawl for {target_url} (max {max_crawl_pages} pages)")
 
         try:
-            result = await self._make_request("POST", endpoint, payload)
+            result = await self._api_request("POST", endpoint, payload)
 
             # Extract task ID from response
             if result.get("tasks") and len(result["tasks"]) > 0:
@@ -259,10 +572,46 @@ class DataForSEOClient:
             logger.error(f"Failed to initiate crawl: {str(e)}")
             raise
 
+    async def task_post_batch(self, targets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Initiate several website crawls with one HTTP request per 100 targets
+
+        Args:
+            targets: Dicts with "target" and optional "max_crawl_pages" (default 100)
+
+        Returns:
+            Task entries in the same order as targets; check each entry's
+            status_code (20100 = created) since tasks can fail individually
+        """
+        endpoint = "on_page/task_post"
+
+        items = [
+            self._task_post_item(t["target"], t.get("max_crawl_pages", 100))
+            for t in targets
+        ]
+
+        logger.info(f"Initiating {len(items)} crawls in batch")
+
+        try:
+            tasks = await self._post_in_chunks(endpoint, items)
+
+            for task in tasks:
+                if task.get("status_code") != 20100:
+                    logger.warning(f"Crawl task failed: {task.get('status_message')}")
+
+            return tasks
+
+        except Exception as e:
+            logger.error(f"Failed to initiate crawl batch: {str(e)}")
+            raise
+
     async def tasks_ready(self) -> Dict[str, Any]:
         """
         Check which tasks are ready for retrieval
 
+        Results are cached for tasks_ready_ttl seconds and concurrent calls
+        share one HTTP request, so treat the returned dict as read-only.
+
         IMPORTANT: Task IDs are in the 'result' array, NOT 'tasks' array!
         The top-level 'id' is the API request ID, not a task ID.
 
@@ -291,8 +640,19 @@ class DataForSEOClient:
         """
         endpoint = "on_page/tasks_ready"
 
+        cached = self._tasks_ready_cache
+        if cached and time.monotonic() - cached[0] < self.tasks_ready_ttl:
+            return cached[1]
+
         try:
-            result = await self._make_request("GET", endpoint)
+            # Single-flight: concurrent callers wait here and reuse the fresh result
+            async with self._tasks_ready_lock:
+                cached = self._tasks_ready_cache
+                if cached and time.monotonic() - cached[0] < self.tasks_ready_ttl:
+                    return cached[1]
+
+                result = await self._api_request("GET", endpoint)
+                self._tasks_ready_cache = (time.monotonic(), result)
 
             # Task IDs are in 'result' array, not 'tasks'
             ready_count = len(result.get("result", []))
@@ -304,18 +664,22 @@ class DataForSEOClient:
             logger.error(f"Failed to check ready tasks: {str(e)}")
             raise
 
-    async def task_status(self, task_id: str) -> Dict[str, Any]:
+    async def task_status(self, task_id: str) -> Tuple[TaskState, Any]:
         """
         Check crawl status using summary endpoint (non-blocking)
 
         IMPORTANT: Use this for polling status during crawl.
         The /summary/ endpoint is available while crawling and returns status.
+        Queued/in-progress tasks are reported through the returned state rather
+        than exceptions, so polling loops stay cheap. Concurrent calls for the
+        same task share one in-flight request.
 
         Args:
             task_id: Task ID from task_post
 
         Returns:
-            Status response with crawl_progress
+            (TaskState, payload): the status response for DONE / IN_QUEUE /
+            IN_PROGRESS, or an error message for ERROR
 
         Example response:
             {
@@ -331,35 +695,113 @@ class DataForSEOClient:
                 }]
             }
         """
+        task = self._inflight_status.get(task_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_task_status(task_id))
+            self._inflight_status[task_id] = task
+
+            def _done(_task: asyncio.Future, task_id: str = task_id):
+                if self._inflight_status.get(task_id) is _task:
+                    del self._inflight_status[task_id]
+
+            task.add_done_callback(_done)
+
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_task_status(self, task_id: str) -> Tuple[TaskState, Any]:
+        """Fetch and classify the summary for one task (see task_status)"""
         endpoint = f"on_page/summary/{task_id}"
         logger.info(f"Checking crawl status for task {task_id} via summary endpoint")
 
         try:
-            result = await self._make_request("GET", endpoint)
+            result = await self._api_request("GET", endpoint)
+        except Exception as e:
+            logger.error(f"Failed to check task status: {str(e)}")
+            raise
 
-            # Validate response structure
-            if not result.get("tasks") or len(result["tasks"]) == 0:
-                raise Exception("No task data returned")
+        # Validate response structure
+        if not result.get("tasks") or len(result["tasks"]) == 0:
+            logger.error("Failed to check task status: No task data returned")
+            return TaskState.ERROR, "No task data returned"
 
-            task_data = result["tasks"][0]
-            status_code = task_data.get("status_code")
+        task_data = result["tasks"][0]
+        state = _task_state(task_data)
+
+        if state == TaskState.ERROR:
             status_msg = task_data.get("status_message", "")
+            logger.error(f"Failed to check task status: Task error: {status_msg}")
+            return state, f"Task error: {status_msg}"
+
+        return state, result
 
-            # Handle in-progress states
-            if status_code == 40100 or "Task In Queue" in status_msg:
-                raise Exception("TASK_IN_QUEUE")
-            elif status_code == 40300 or "Task In Progress" in status_msg:
-                raise Exception("TASK_IN_PROGRESS")
-            elif status_code != 20000:
-                raise Exception(f"Task error: {status_msg}")
+    async def task_status_raise(self, task_id: str) -> Dict[str, Any]:
+        """
+        task_status with the original exception-based interface
 
+        Raises:
+            Exception: "TASK_IN_QUEUE" / "TASK_IN_PROGRESS" while the crawl is
+            running, or the error message on task errors
+        """
+        state, result = await self.task_status(task_id)
+        if state == TaskState.DONE:
             return result
+        raise Exception(_IN_PROGRESS_MARKERS.get(state, result))
 
-        except Exception as e:
-            logger.error(f"Failed to check task status: {str(e)}")
-            raise
+    async def wait_for_task(
+        self,
+        task_id: str,
+        max_wait: float = 3600,
+        base_interval: float = 5.0
+    ) -> Dict[str, Any]:
+        """
+        Poll the summary endpoint until a crawl finishes, backing off between polls
 
-    async def task_get(self, task_id: str) -> Dict[str, Any]:
+        The interval grows by 1.5x per poll (capped at 60s, with jitter) and is
+        stretched further while many pages are still queued. Retry-After hints
+        on 429s are honoured by the request's own retry loop.
+
+        Args:
+            task_id: Task ID from task_post
+            max_wait: Maximum total seconds to wait (default 3600)
+            base_interval: Initial poll interval in seconds (default 5)
+
+        Returns:
+            Final summary response (crawl_progress == "finished")
+
+        Raises:
+            Exception: On task errors or if the crawl doesn't finish within max_wait
+        """
+        async def poll() -> Dict[str, Any]:
+            attempt = 0
+            while True:
+                crawl_status: Dict[str, Any] = {}
+                state, result = await self.task_status(task_id)
+                if state == TaskState.ERROR:
+                    raise Exception(result)
+                if state == TaskState.DONE:
+                    crawl_result = (result["tasks"][0].get("result") or [{}])[0]
+                    if crawl_result.get("crawl_progress") == "finished":
+                        return result
+                    crawl_status = crawl_result.get("crawl_status") or crawl_result
+
+                delay = min(60, base_interval * 1.5 ** attempt) * (1 + random.random() * self.jitter)
+
+                # Long queues mean a long crawl - no point checking back soon
+                pages_in_queue = crawl_status.get("pages_in_queue") or 0
+                if pages_in_queue:
+                    delay = min(120, delay * (1 + pages_in_queue / 100))
+
+                attempt += 1
+                logger.info(f"Task {task_id} not finished, next poll in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        try:
+            return await asyncio.wait_for(poll(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            raise Exception(f"Task {task_id} did not finish within {max_wait}s")
+
+    async def task_get(self, task_id: str) -> Tuple[TaskState, Any]:
         """
         Retrieve COMPLETE results with page data for a finished crawl
 
@@ -370,7 +812,8 @@ class DataForSEOClient:
             task_id: Task ID from task_post
 
         Returns:
-            Complete crawl results with page data
+            (TaskState, payload): the complete crawl results for DONE, the raw
+            response for IN_QUEUE / IN_PROGRESS, or an error message for ERROR
 
         Example response:
             {
@@ -396,57 +839,199 @@ class DataForSEOClient:
         logger.info(f"Retrieving page data for task {task_id} via pages endpoint (POST)")
 
         try:
-            result = await self._make_request("POST", endpoint, payload)
+            result = await self._api_request("POST", endpoint, payload)
+        except Exception as e:
+            logger.error(f"Failed to retrieve task results: {str(e)}")
+            raise
+
+        # Validate response structure
+        if not result.get("tasks") or len(result["tasks"]) == 0:
+            logger.error("Failed to retrieve task results: No task data returned")
+            return TaskState.ERROR, "No task data returned"
 
-            # Validate response structure
-            if not result.get("tasks") or len(result["tasks"]) == 0:
-                raise Exception("No task data returned")
+        task_data = result["tasks"][0]
 
-            task_data = result["tasks"][0]
+        # 40100 / 40300 = still processing - not an error!
+        state = _task_state(task_data)
 
-            # Check task status
-            status_code = task_data.get("status_code")
+        if state == TaskState.ERROR:
             status_msg = task_data.get("status_message", "")
+            logger.error(f"Failed to retrieve task results: Task failed: {status_msg}")
+            return state, f"Task failed: {status_msg}"
+
+        if state != TaskState.DONE:
+            return state, result
 
-            # Status codes:
-            # 20000 = OK (task completed successfully)
-            # 40100 = Task In Queue (still processing - not an error!)
-            # 40300 = Task In Progress (still processing - not an error!)
-            if status_code == 40100 or "Task In Queue" in status_msg:
-                raise Exception("TASK_IN_QUEUE")  # Special marker for in-progress tasks
-            elif status_code == 40300 or "Task In Progress" in status_msg:
-                raise Exception("TASK_IN_PROGRESS")  # Special marker for in-progress tasks
-            elif status_code != 20000:
-                raise Exception(f"Task failed: {status_msg}")
+        # Check if task has results
+        if not task_data.get("result"):
+            logger.error("Failed to retrieve task results: No results available for task")
+            return TaskState.ERROR, "No results available for task"
 
-            # Check if task has results
-            if not task_data.get("result"):
-                raise Exception("No results available for task")
+        pages_crawled = task_data["result"][0].get("pages_crawled", 0)
+        logger.info(f"Retrieved results for {pages_crawled} crawled pages")
 
-            pages_crawled = task_data["result"][0].get("pages_crawled", 0)
-            logger.info(f"Retrieved results for {pages_crawled} crawled pages")
+        return state, result
 
+    async def task_get_raise(self, task_id: str) -> Dict[str, Any]:
+        """
+        task_get with the original exception-based interface
+
+        Raises:
+            Exception: "TASK_IN_QUEUE" / "TASK_IN_PROGRESS" while the crawl is
+            running, or the error message on task errors
+        """
+        state, result = await self.task_get(task_id)
+        if state == TaskState.DONE:
             return result
+        raise Exception(_IN_PROGRESS_MARKERS.get(state, result))
+
+    async def task_get_batch(self, task_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieve page data for several finished crawls with one HTTP request per 100 tasks
+
+        Args:
+            task_ids: Task IDs from task_post / task_post_batch
+
+        Returns:
+            Task entries in the same order as task_ids; check each entry's
+            status_code (20000 = OK, 40100/40300 = still processing)
+        """
+        endpoint = "on_page/pages"
+
+        items = [{"id": task_id} for task_id in task_ids]
+
+        logger.info(f"Retrieving page data for {len(items)} tasks in batch")
+
+        try:
+            tasks = await self._post_in_chunks(endpoint, items)
+
+            for task in tasks:
+                if task.get("status_code") != 20000:
+                    logger.warning(f"Task {task.get('id')} not ready: {task.get('status_message')}")
+
+            return tasks
 
         except Exception as e:
-            logger.error(f"Failed to retrieve task results: {str(e)}")
+            logger.error(f"Failed to retrieve batch results: {str(e)}")
             raise
 
+    async def task_get_stream(self, task_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield page records for a finished crawl while the response is downloading
+
+        Unlike task_get, the page data is parsed incrementally, so memory use
+        doesn't grow with the number of crawled pages. Falls back to the
+        buffered task_get when ijson isn't installed. Concurrency slots are
+        held only while reading from the network, never while the caller
+        processes a yielded record.
+
+        Args:
+            task_id: Task ID from task_post
+
+        Yields:
+            Page records from tasks[0].result[0].items
+
+        Raises:
+            Exception: "TASK_IN_QUEUE" / "TASK_IN_PROGRESS" while the crawl is
+            still running, on task errors, or on a non-200 response
+        """
+        if ijson is None:
+            result = await self.task_get_raise(task_id)
+            for item in result["tasks"][0]["result"][0].get("items") or []:
+                yield item
+            return
+
+        endpoint = "on_page/pages"
+        url = f"{self.base_url}/{endpoint}"
+
+        logger.info(f"Streaming page data for task {task_id} via pages endpoint (POST)")
+
+        await self._wait_if_throttled()
+        session = await self._get_session()
+
+        async with self._api_sem:
+            async with self._limiter:
+                response = await session.post(url, data=_json_dumps([{"id": task_id}]))
+                if response.status != 200:
+                    async with response:
+                        body = await response.content.read(MAX_ERROR_BODY_BYTES)
+
+        if response.status != 200:
+            if response.status in (429, 502, 503):
+                self._record_overload()
+            # Raises for every non-200 status
+            self._handle_response(response, body, endpoint)
+
+        async with response:
+            events = ijson.sendable_list()
+            parser = ijson.parse_coro(events, use_float=True)
+            task_status: Dict[str, Any] = {}
+            builder = None
+            count = 0
+
+            while True:
+                async with self._api_sem:
+                    async with self._limiter:
+                        chunk = await response.content.read(STREAM_CHUNK_BYTES)
+                if chunk:
+                    parser.send(chunk)
+                else:
+                    parser.close()
+
+                for prefix, event, value in events:
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == _PAGE_ITEM_PREFIX and event == "end_map":
+                            count += 1
+                            yield builder.value
+                            builder = None
+                    elif prefix == _PAGE_ITEM_PREFIX and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "status_code" and value >= 40000:
+                        raise Exception(f"DataForSEO error: status {value}")
+                    elif prefix == "tasks.item.status_code":
+                        task_status["status_code"] = value
+                    elif prefix == "tasks.item.status_message":
+                        task_status["status_message"] = value
+                    elif (prefix == "tasks.item.result" and event in ("start_array", "null")) or \
+                            (prefix == "tasks.item" and event == "end_map"):
+                        # Task status precedes its results in the response
+                        state = _task_state(task_status)
+                        if state == TaskState.ERROR:
+                            raise Exception(f"Task failed: {task_status.get('status_message', '')}")
+                        elif state != TaskState.DONE:
+                            raise Exception(_IN_PROGRESS_MARKERS[state])
+                del events[:]
+
+                if not chunk:
+                    break
+
+        logger.info(f"Streamed {count} crawled pages")
+
 
 # Test function (for development)
 async def test_client():
-    """Test the DataForSEO client"""
-    client = DataForSEOClient()
+    """Test the DataForSEO client over a single pooled session"""
+    async with DataForSEOClient() as client:
+        # Test task_post
+        result = await client.task_post("https://example.com", max_crawl_pages=10)
+        print(f"Task posted: {result}")
+
+        # Test tasks_ready (reuses the connection opened by task_post)
+        ready = await client.tasks_ready()
+        print(f"Ready tasks: {ready}")
 
-    # Test task_post
-    result = await client.task_post("https://example.com", max_crawl_pages=10)
-    print(f"Task posted: {result}")
+        ready = await client.tasks_ready()
+        print(f"Ready tasks (second call): {len(ready.get('result', []))}")
 
-    # Test tasks_ready
-    ready = await client.tasks_ready()
-    print(f"Ready tasks: {ready}")
+
+def main():
+    """Command-line entrypoint"""
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(test_client())
 
 
 if __name__ == "__main__":
     # Run test
-    asyncio.run(test_client())
+    main()
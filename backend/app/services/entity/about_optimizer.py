@@ -3,11 +3,29 @@ About Page Optimizer
 Analyzes and optimizes About pages for entity recognition
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
 import re
 from typing import List, Dict, Optional, Any, Tuple
+from bisect import bisect_right
 from datetime import datetime
-from collections import Counter
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to per-signal substring checks
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional (x86 only); fall back to the fused regex
+    hyperscan = None
 
 from app.models.entity_models import (
     AboutPageMetrics,
@@ -17,56 +35,533 @@ from app.models.entity_models import (
 
 logger = logging.getLogger(__name__)
 
+# site_data fields that influence the analysis (besides the About content itself)
+_SITE_DATA_KEYS = ("business_name", "phone", "email", "address", "about_images_count")
+
+# LRU cache of analyses keyed by (content digest, relevant site_data values)
+_ANALYSIS_CACHE_MAX = 512
+_analysis_cache: "OrderedDict[tuple, AboutPageOptimizationResponse]" = OrderedDict()
+
+# Process pool for batch analyses, created on first use and closed by
+# shutdown_process_pool(); sized by ABOUT_ANALYSIS_WORKERS (default: CPU count)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = int(os.getenv("ABOUT_ANALYSIS_WORKERS", "0")) or os.cpu_count() or 1
+
+# Batches with fewer uncached pages than this are analyzed inline: each
+# analysis takes about a millisecond, so process dispatch only pays off at volume
+_PARALLEL_ANALYSIS_MIN = 32
+
+# Per-process optimizer used by _analyze_content in pool workers
+_worker_optimizer: Optional["AboutPageOptimizer"] = None
+
+# UTF-8 of the non-ASCII characters that IGNORECASE folds onto ASCII letters
+# (İ, ı, ſ, Kelvin sign); their presence sends the name count to the regex path
+_ASCII_FOLDING_CHARS = tuple(c.encode("utf-8") for c in "\u0130\u0131\u017f\u212a")
+
+
+@lru_cache(maxsize=256)
+def _business_name_re(business_name: str) -> "re.Pattern[str]":
+    """Compiled case-insensitive whole-word pattern for a business name"""
+    return re.compile(r'\b' + re.escape(business_name) + r'\b', re.IGNORECASE)
+
+
+def _is_word_char(content_lower: bytes, start: int, end: int) -> bool:
+    """Whether the UTF-8 character at content_lower[start:end] matches \\w"""
+    char = content_lower[start:end].decode("utf-8", "ignore")[:1]
+    return bool(char) and (char.isalnum() or char == "_")
+
+
+def _word_before(content_lower: bytes, pos: int) -> bool:
+    """Whether the character ending at byte offset pos is a word character"""
+    if pos == 0:
+        return False
+    start = pos - 1
+    while start > 0 and 0x80 <= content_lower[start] < 0xC0:
+        start -= 1
+    return _is_word_char(content_lower, start, pos)
+
+
+def _word_after(content_lower: bytes, pos: int) -> bool:
+    """Whether the character starting at byte offset pos is a word character"""
+    if pos >= len(content_lower):
+        return False
+    return _is_word_char(content_lower, pos, pos + 4)
+
+
+def _count_name_mentions(business_name: str, content: str, content_lower: bytes) -> int:
+    """
+    Count whole-word, case-insensitive mentions of the business name.
+
+    Equivalent to counting r'\bNAME\b' matches with re.IGNORECASE. ASCII
+    names are found with bytes.find on the lowercased UTF-8 buffer and each
+    hit's boundaries are checked directly; other names use the regex.
+    """
+    if not business_name.isascii() or any(
+        char in content_lower for char in _ASCII_FOLDING_CHARS
+    ):
+        return sum(1 for _ in _business_name_re(business_name).finditer(content))
+
+    needle = business_name.lower().encode("ascii")
+    size = len(needle)
+    # \b on each side holds when the word-ness on either side of it differs
+    head_word = _is_word_char(needle, 0, 1)
+    tail_word = _is_word_char(needle, size - 1, size)
+
+    count = 0
+    pos = content_lower.find(needle)
+    while pos != -1:
+        end = pos + size
+        if (
+            _word_before(content_lower, pos) != head_word
+            and _word_after(content_lower, end) != tail_word
+        ):
+            count += 1
+            pos = content_lower.find(needle, end)
+        else:
+            pos = content_lower.find(needle, pos + 1)
+
+    return count
+
+
+def _cache_key(content: str, site_data: Optional[Dict]) -> tuple:
+    """
+    Analysis cache key: the analysis only depends on the content and a few
+    site_data fields, so repeat requests are served from the LRU cache
+    """
+    # site_data values may be unhashable (e.g. a structured address dict), so
+    # they are keyed by a digest of their canonical JSON form
+    site_digest = None
+    if site_data:
+        site_digest = hashlib.blake2b(
+            json.dumps(
+                [site_data.get(key) for key in _SITE_DATA_KEYS],
+                sort_keys=True,
+                default=str
+            ).encode("utf-8", "surrogatepass"),
+            digest_size=16
+        ).hexdigest()
+    return (
+        hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest(),
+        site_digest
+    )
+
+
+def _cache_get(key: tuple) -> Optional[AboutPageOptimizationResponse]:
+    """Look up a cached analysis, marking it most recently used"""
+    analysis = _analysis_cache.get(key)
+    if analysis is not None:
+        _analysis_cache.move_to_end(key)
+    return analysis
+
+
+def _cache_put(key: tuple, analysis: AboutPageOptimizationResponse) -> None:
+    """Store an analysis, evicting the least recently used entry when full"""
+    _analysis_cache[key] = analysis
+    if len(_analysis_cache) > _ANALYSIS_CACHE_MAX:
+        _analysis_cache.popitem(last=False)
+
+
+def _relevant_site_data(site_data: Optional[Dict]) -> Optional[Dict]:
+    """Trim site_data to the fields the analysis reads (keeps pool pickling small)"""
+    if not site_data:
+        return site_data
+    return {key: site_data[key] for key in _SITE_DATA_KEYS if key in site_data}
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Shared process pool for batch analyses"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=_POOL_WORKERS)
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the batch analysis pool (called on application shutdown)"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+
+def _analyze_content(
+    content: str,
+    site_data: Optional[Dict]
+) -> AboutPageOptimizationResponse:
+    """Run the About page analysis in a pool worker (module-level so it pickles)"""
+    global _worker_optimizer
+    if _worker_optimizer is None:
+        _worker_optimizer = AboutPageOptimizer()
+    return _worker_optimizer._analyze(content, site_data)
+
+
+class MissingElement(IntEnum):
+    """Content elements an About page can be missing"""
+    ORIGIN = 1
+    MISSION = 2
+    TEAM = 3
+    CREDENTIALS = 4
+    CONTACT = 5
+    ACHIEVEMENTS = 6
+    EXPERIENCE = 7
+    VALUE_PROP = 8
+    SERVICE_AREA = 9
+    VISUAL = 10
+
+    @property
+    def bit(self) -> int:
+        """Bit for this element in a probe bitmask"""
+        return 1 << self
+
+
+# Missing-element keyword probes over the lowercased UTF-8 content:
+# (name, alternation, elements the probe confirms). Each alternation is
+# matched as whole words. The bytes scans match the original str regex only
+# for ASCII content; non-ASCII content goes through _scan_probes_text.
+_MISSING_PROBES = (
+    ("established", rb"established", (MissingElement.ORIGIN, MissingElement.EXPERIENCE)),
+    ("origin", rb"founded|started|began|origin|history", (MissingElement.ORIGIN,)),
+    ("mission", rb"mission|vision|purpose|why we|believe", (MissingElement.MISSION,)),
+    ("credentials", rb"certified|licensed|qualified|credentials|education", (MissingElement.CREDENTIALS,)),
+    ("experience", rb"years|since|experience", (MissingElement.EXPERIENCE,)),
+    ("value_prop", rb"unique|different|why choose|our approach|what sets us", (MissingElement.VALUE_PROP,)),
+    ("service_area", rb"serving|based in|located|area|region|local", (MissingElement.SERVICE_AREA,)),
+)
+_MISSING_PROBE_MASKS = tuple(
+    sum(element.bit for element in elements) for _, _, elements in _MISSING_PROBES
+)
+_MISSING_PROBE_ALL = sum({
+    element.bit for _, _, elements in _MISSING_PROBES for element in elements
+})
+
+# ASCII word characters; \b in the bytes probes is ASCII-only
+_ASCII_WORD_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+)
+
+# Trust signal keywords: (category, phrases)
+_TRUST_SIGNALS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("experience", (
+        "years of experience", "since", "founded", "established",
+        "decades", "experienced", "veteran", "expertise"
+    )),
+    ("credentials", (
+        "certified", "licensed", "accredited", "qualified",
+        "trained", "certified professional", "board certified"
+    )),
+    ("team", (
+        "team", "employees", "staff", "professionals",
+        "specialists", "experts", "our people"
+    )),
+    ("achievements", (
+        "award", "recognition", "achievement", "milestone",
+        "success", "accomplishment", "distinguished", "honored"
+    )),
+    ("scale", (
+        "clients served", "projects completed", "customers",
+        "satisfied clients", "successful projects"
+    )),
+    ("location", (
+        "based in", "located in", "serving", "headquarters",
+        "office in", "local", "community"
+    )),
+    ("values", (
+        "mission", "vision", "values", "commitment", "dedicated",
+        "focused", "believe", "philosophy"
+    )),
+    ("quality", (
+        "quality", "excellence", "best", "top-rated", "leading",
+        "premier", "superior", "exceptional"
+    )),
+)
+
+# Trust signal phrases as bytes, for search in the lowercased UTF-8 content
+_TRUST_SIGNAL_BYTES = tuple(
+    signal.encode() for _, signals in _TRUST_SIGNALS for signal in signals
+)
+
+_REQUIRED_ELEMENTS = (
+    "business_story",
+    "team_information",
+    "credentials",
+    "contact_information",
+    "value_proposition",
+)
+
+
+# Canned recommendation action items, shared (immutable) across responses
+_CONTENT_LENGTH_ACTIONS = (
+    "Add detailed company history",
+    "Include team member bios",
+    "Expand on your unique value proposition",
+    "Add more about your credentials and experience",
+)
+_TRUST_SIGNAL_ACTIONS = (
+    "Mention years in business",
+    "List certifications and licenses",
+    "Include client testimonials or case studies",
+    "Add team credentials and qualifications",
+)
+_TEAM_ACTIONS = (
+    "Create profiles for founders and key team members",
+    "Include names, titles, and credentials",
+    "Add professional photos",
+    "Mention relevant experience and expertise",
+)
+_CONTACT_ACTIONS = (
+    "Add phone number",
+    "Add email address",
+    "Add physical address (if applicable)",
+    "Ensure consistency with other pages",
+)
+_VISUAL_ACTIONS = (
+    "Add team photos",
+    "Include office/workspace images",
+    "Show your work or products",
+    "Add founder/leadership photos",
+)
+
+
+# Quality score tables: points[i] applies when the value is at least
+# thresh[i - 1] (bisect_right index)
+_WC_THRESH = (150, 300, 500, 800)
+_WC_POINTS = (5, 10, 15, 20, 25)
+_MENTION_THRESH = (1, 3, 5)
+_MENTION_POINTS = (0, 8, 12, 15)
+_TRUST_THRESH = (3, 6, 10)
+_TRUST_POINTS = (5, 10, 15, 20)
+_TEAM_THRESH = (1, 3, 5)
+_TEAM_POINTS = (0, 8, 12, 15)
+_ACHIEVEMENT_THRESH = (1, 3, 5)
+_ACHIEVEMENT_POINTS = (0, 4, 7, 10)
+_VISUAL_THRESH = (1, 3, 5)
+_VISUAL_POINTS = (0, 2, 4, 5)
+
+
+def _score(
+    word_count: int,
+    entity_mentions: int,
+    trust_signals: int,
+    team_members: int,
+    achievements: int,
+    contact_complete: bool,
+    visual_content: int
+) -> int:
+    """About page quality score (0-100) from the score tables"""
+    score = (
+        _WC_POINTS[bisect_right(_WC_THRESH, word_count)]
+        + _MENTION_POINTS[bisect_right(_MENTION_THRESH, entity_mentions)]
+        + _TRUST_POINTS[bisect_right(_TRUST_THRESH, trust_signals)]
+        + _TEAM_POINTS[bisect_right(_TEAM_THRESH, team_members)]
+        + _ACHIEVEMENT_POINTS[bisect_right(_ACHIEVEMENT_THRESH, achievements)]
+        + (10 if contact_complete else 0)
+        + _VISUAL_POINTS[bisect_right(_VISUAL_THRESH, visual_content)]
+    )
+
+    return min(100, score)
+
+
+@lru_cache(maxsize=None)
+def _keyword_matchers() -> Tuple[Any, Any]:
+    """
+    Build the shared trust signal / missing-probe keyword matcher
+
+    Trust signals and missing-element probes share one keyword scan (many
+    probe words are trust signals too), using Hyperscan when available, else
+    Aho-Corasick, else neither (substring checks plus the probe regex).
+
+    Returns:
+        (Hyperscan database or None, Aho-Corasick automaton or None)
+    """
+    if hyperscan is not None:
+        # Probe expressions take ids 0..P-1 and trust signal literals
+        # P..P+S-1; single-match so each id reports once. Like the bytes
+        # regex, Hyperscan's \b is ASCII-only (fine for the ASCII content
+        # whose probe results are used).
+        expressions = [rb'\b(?:' + words + rb')\b' for _, words, _ in _MISSING_PROBES]
+        expressions.extend(re.escape(signal) for signal in _TRUST_SIGNAL_BYTES)
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+        )
+        return database, None
+
+    if ahocorasick is not None:
+        # Each keyword maps to (trust signal index or -1, probe mask);
+        # probe words need a whole-word check at each hit
+        keywords: Dict[str, List[int]] = {}
+        for index, signal in enumerate(_TRUST_SIGNAL_BYTES):
+            keywords.setdefault(signal.decode(), [-1, 0])[0] = index
+        for (_, words, _), mask in zip(_MISSING_PROBES, _MISSING_PROBE_MASKS):
+            for word in words.decode().split("|"):
+                keywords.setdefault(word, [-1, 0])[1] |= mask
+        automaton = ahocorasick.Automaton()
+        for word, (index, mask) in keywords.items():
+            automaton.add_word(word, (len(word), index, mask))
+        automaton.make_automaton()
+        return None, automaton
+
+    return None, None
+
+
+# Display text for each missing element in the response
+_MISSING_TEXT = {
+    MissingElement.ORIGIN: "Origin story or company history",
+    MissingElement.MISSION: "Mission, vision, or purpose statement",
+    MissingElement.TEAM: "Team member profiles or bios",
+    MissingElement.CREDENTIALS: "Professional credentials or certifications",
+    MissingElement.CONTACT: "Complete contact information (phone, email, address)",
+    MissingElement.ACHIEVEMENTS: "Awards, achievements, or notable milestones",
+    MissingElement.EXPERIENCE: "Years of experience or founding date",
+    MissingElement.VALUE_PROP: "Unique value proposition or differentiators",
+    MissingElement.SERVICE_AREA: "Service area or geographic location",
+    MissingElement.VISUAL: "Team photos, office images, or visual content",
+}
+
 
 class AboutPageOptimizer:
     """Optimize About pages for entity recognition and trust"""
 
-    def __init__(self):
-        """Initialize about page optimizer"""
-        # Trust signal keywords
-        self.trust_signals = {
-            "experience": [
-                "years of experience", "since", "founded", "established",
-                "decades", "experienced", "veteran", "expertise"
-            ],
-            "credentials": [
-                "certified", "licensed", "accredited", "qualified",
-                "trained", "certified professional", "board certified"
-            ],
-            "team": [
-                "team", "employees", "staff", "professionals",
-                "specialists", "experts", "our people"
-            ],
-            "achievements": [
-                "award", "recognition", "achievement", "milestone",
-                "success", "accomplishment", "distinguished", "honored"
-            ],
-            "scale": [
-                "clients served", "projects completed", "customers",
-                "satisfied clients", "successful projects"
-            ],
-            "location": [
-                "based in", "located in", "serving", "headquarters",
-                "office in", "local", "community"
-            ],
-            "values": [
-                "mission", "vision", "values", "commitment", "dedicated",
-                "focused", "believe", "philosophy"
-            ],
-            "quality": [
-                "quality", "excellence", "best", "top-rated", "leading",
-                "premier", "superior", "exceptional"
-            ]
+    __slots__ = ("_keyword_db", "_trust_automaton")
+
+    # Trust signal keywords by category
+    trust_signals = dict(_TRUST_SIGNALS)
+
+    # Required elements for a complete About page
+    required_elements = _REQUIRED_ELEMENTS
+
+    # Missing-element keyword probes, scanned in one pass over the lowercased
+    # UTF-8 of ASCII content. "established" counts for both the origin and
+    # experience probes, so it gets its own group
+    _MISSING_PROBES_RE = re.compile(
+        rb'\b(?:'
+        + rb'|'.join(rb'(?P<%s>%s)' % (name.encode(), words) for name, words, _ in _MISSING_PROBES)
+        + rb')\b'
+    )
+    _MISSING_PROBE_GROUPS = {
+        name: mask for (name, _, _), mask in zip(_MISSING_PROBES, _MISSING_PROBE_MASKS)
+    }
+
+    # The same probes as a case-insensitive str pattern, for content with
+    # non-ASCII characters: there the bytes pattern's ASCII-only \b and
+    # lowercasing would treat letters like "é" or "ſ" differently
+    _MISSING_PROBES_TEXT_RE = re.compile(
+        r'\b(?:'
+        + r'|'.join(r'(?P<%s>%s)' % (name, words.decode()) for name, words, _ in _MISSING_PROBES)
+        + r')\b',
+        re.IGNORECASE
+    )
+
+    # Contact information
+    _CONTACT_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+    _CONTACT_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    _CONTACT_ADDRESS_RE = re.compile(
+        r'\b\d+\s+\w+\s+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)\b', re.IGNORECASE
+    )
+
+    # Team member and achievement mentions
+    _TEAM_PATTERNS = (
+        re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+,\s+(?:CEO|CTO|CFO|Founder|Director|Manager)'),
+        re.compile(r'(?:CEO|CTO|CFO|Founder|Director|Manager):\s+[A-Z][a-z]+\s+[A-Z][a-z]+'),
+        re.compile(r'\b(?:our|the)\s+(?:CEO|founder|director|manager|president)'),
+    )
+    _ACHIEVEMENT_PATTERNS = (
+        re.compile(
+            r'\b(?:won|received|earned|awarded)\s+(?:the\s+)?[A-Z][a-zA-Z\s]+(?:Award|Prize|Recognition)',
+            re.IGNORECASE
+        ),
+        re.compile(r'\b[A-Z][a-zA-Z\s]+(?:Award|Prize)\b', re.IGNORECASE),
+        re.compile(r'\b(?:top|best|leading|premier)\s+\w+\b', re.IGNORECASE),
+    )
+
+    # Schema opportunity probes, scanned in one pass; group names identify
+    # the probe. The timeline probe is case-sensitive, the others are not.
+    _SCHEMA_PROBES_RE = re.compile(
+        r'\b(?:'
+        r'(?P<team>(?i:CEO|founder|director|team))'
+        r'|(?P<timeline>founded|since|established|\d{4})'
+        r'|(?P<awards>(?i:award|recognition|achievement))'
+        r'|(?P<faq>(?i:question|answer|faq|why|how|what))'
+        r')\b'
+    )
+    # Literal words of the case-insensitive probes, for a substring pre-check
+    _SCHEMA_PROBE_KEYWORDS = (
+        ("team", (b"team", b"ceo", b"founder", b"director")),
+        ("awards", (b"award", b"recognition", b"achievement")),
+        ("faq", (b"what", b"how", b"why", b"question", b"answer", b"faq")),
+    )
+
+    # Section suggestion for each missing element
+    _SUGGESTION_TEMPLATES = {
+        MissingElement.ORIGIN: {
+            "section": "Company History",
+            "content": "Add a section describing how and why your business was founded. Include the year, founder names, and the problem you set out to solve.",
+            "priority": "high",
+            "estimated_length": "150-250 words"
+        },
+        MissingElement.MISSION: {
+            "section": "Mission & Values",
+            "content": "Define your company's mission, core values, and what drives your work. Make it authentic and specific to your business.",
+            "priority": "high",
+            "estimated_length": "100-200 words"
+        },
+        MissingElement.TEAM: {
+            "section": "Our Team",
+            "content": "Include profiles of key team members with names, titles, credentials, and brief bios. Add professional photos.",
+            "priority": "high",
+            "estimated_length": "50-100 words per person"
+        },
+        MissingElement.CREDENTIALS: {
+            "section": "Credentials & Certifications",
+            "content": "List professional licenses, certifications, industry accreditations, and qualifications that establish your expertise.",
+            "priority": "high",
+            "estimated_length": "100-150 words"
+        },
+        MissingElement.CONTACT: {
+            "section": "Contact Information",
+            "content": "Ensure your About page includes phone number, email address, and physical address (if applicable). Consider adding a contact form.",
+            "priority": "high",
+            "estimated_length": "N/A"
+        },
+        MissingElement.ACHIEVEMENTS: {
+            "section": "Awards & Recognition",
+            "content": "Highlight awards, industry recognition, notable clients, or significant milestones that demonstrate your credibility.",
+            "priority": "medium",
+            "estimated_length": "100-200 words"
+        },
+        MissingElement.EXPERIENCE: {
+            "section": "Experience",
+            "content": "Specify how long you've been in business, years of combined team experience, or number of projects completed.",
+            "priority": "medium",
+            "estimated_length": "50-100 words"
+        },
+        MissingElement.VALUE_PROP: {
+            "section": "What Sets Us Apart",
+            "content": "Clearly articulate what makes your business different from competitors. Focus on unique approaches, specializations, or guarantees.",
+            "priority": "high",
+            "estimated_length": "150-250 words"
+        },
+        MissingElement.SERVICE_AREA: {
+            "section": "Service Area",
+            "content": "Clearly state your geographic service area, whether local, regional, or national. Important for local SEO.",
+            "priority": "medium",
+            "estimated_length": "50-100 words"
+        },
+        MissingElement.VISUAL: {
+            "section": "Visual Elements",
+            "content": "Add professional photos of your team, office/workspace, completed projects, or work in progress. Builds trust and engagement.",
+            "priority": "medium",
+            "estimated_length": "N/A"
         }
+    }
 
-        # Required elements for a complete About page
-        self.required_elements = [
-            "business_story",
-            "team_information",
-            "credentials",
-            "contact_information",
-            "value_proposition"
-        ]
+    def __init__(self):
+        """Initialize about page optimizer"""
+        # Keyword matchers are immutable and built once per process
+        self._keyword_db, self._trust_automaton = _keyword_matchers()
 
     async def optimize_about_page(
         self,
@@ -91,48 +586,156 @@ class AboutPageOptimizer:
                 site_data
             )
 
-            # Calculate metrics
-            metrics = self._calculate_metrics(about_content, site_data)
+            cache_key = _cache_key(about_content, site_data)
+            analysis = _cache_get(cache_key)
+            if analysis is None:
+                analysis = self._analyze(about_content, site_data)
+                _cache_put(cache_key, analysis)
 
-            # Identify missing elements
-            missing_elements = self._identify_missing_elements(
-                about_content,
-                metrics
-            )
+            return analysis.model_copy(update={"analyzed_at": datetime.now()}, deep=True)
 
-            # Generate content suggestions
-            content_suggestions = self._generate_content_suggestions(
-                about_content,
-                missing_elements,
-                metrics
-            )
+        except Exception as e:
+            logger.error(f"Error optimizing about page: {str(e)}")
+            raise
 
-            # Identify schema opportunities
-            schema_opportunities = self._identify_schema_opportunities(
-                about_content,
-                site_data
-            )
+    async def optimize_about_pages(
+        self,
+        items: List[Tuple[AboutPageOptimizationRequest, Optional[Dict]]]
+    ) -> List[AboutPageOptimizationResponse]:
+        """
+        Analyze and optimize many About pages
 
-            # Generate recommendations
-            recommendations = self._generate_recommendations(
-                metrics,
-                missing_elements,
-                schema_opportunities
-            )
+        Content for all pages is fetched concurrently and each distinct page
+        is analyzed once. Large batches of cache misses are spread across a
+        process pool, which keeps the event loop free; smaller ones run inline.
 
-            return AboutPageOptimizationResponse(
-                current_metrics=metrics,
-                missing_elements=missing_elements,
-                content_suggestions=content_suggestions,
-                schema_opportunities=schema_opportunities,
-                recommendations=recommendations,
-                analyzed_at=datetime.now()
-            )
+        Args:
+            items: (request, site_data) pairs, as for optimize_about_page
+
+        Returns:
+            Responses in the same order as items
+        """
+        if len(items) <= 1:
+            return [
+                await self.optimize_about_page(request, site_data)
+                for request, site_data in items
+            ]
+
+        try:
+            contents = await asyncio.gather(*(
+                self._get_about_content(request.site_url, request.about_page_url, site_data)
+                for request, site_data in items
+            ))
+
+            keys = [
+                _cache_key(content, site_data)
+                for content, (_, site_data) in zip(contents, items)
+            ]
+            analyses = [_cache_get(key) for key in keys]
+
+            # One job per distinct uncached page; workers only need the
+            # site_data fields the analysis reads
+            pending: Dict[tuple, int] = {}
+            for index, (key, analysis) in enumerate(zip(keys, analyses)):
+                if analysis is None and key not in pending:
+                    pending[key] = index
+
+            if len(pending) >= _PARALLEL_ANALYSIS_MIN and _POOL_WORKERS > 1:
+                loop = asyncio.get_running_loop()
+                pool = _get_process_pool()
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(
+                        pool,
+                        _analyze_content,
+                        contents[index],
+                        _relevant_site_data(items[index][1])
+                    )
+                    for index in pending.values()
+                ))
+            else:
+                results = [
+                    self._analyze(contents[index], items[index][1])
+                    for index in pending.values()
+                ]
+
+            if pending:
+                fresh = dict(zip(pending, results))
+                for key, analysis in fresh.items():
+                    _cache_put(key, analysis)
+                analyses = [
+                    analysis if analysis is not None else fresh[key]
+                    for key, analysis in zip(keys, analyses)
+                ]
+
+            now = datetime.now()
+            return [
+                analysis.model_copy(update={"analyzed_at": now}, deep=True)
+                for analysis in analyses
+            ]
 
         except Exception as e:
-            logger.error(f"Error optimizing about page: {str(e)}")
+            logger.error(f"Error optimizing about pages: {str(e)}")
             raise
 
+    def _analyze(
+        self,
+        about_content: str,
+        site_data: Optional[Dict]
+    ) -> AboutPageOptimizationResponse:
+        """Run the content analysis (a pure function of content and site_data)"""
+        # Lowercased once for all case-insensitive literal/keyword checks
+        content_lower = about_content.encode("utf-8", "ignore").lower()
+
+        # One keyword scan for trust signals and missing-element probes
+        trust_signals_count, probe_mask = self._scan_keywords(content_lower)
+        if not about_content.isascii():
+            probe_mask = self._scan_probes_text(about_content)
+
+        # Calculate metrics
+        metrics = self._calculate_metrics(
+            about_content,
+            site_data,
+            content_lower,
+            trust_signals_count
+        )
+
+        # Identify missing elements
+        missing = self._identify_missing_elements(
+            probe_mask,
+            metrics
+        )
+        missing_elements = [_MISSING_TEXT[element] for element in missing]
+
+        # Generate content suggestions
+        content_suggestions = self._generate_content_suggestions(
+            about_content,
+            missing,
+            metrics
+        )
+
+        # Identify schema opportunities
+        schema_opportunities = self._identify_schema_opportunities(
+            about_content,
+            site_data,
+            content_lower
+        )
+
+        # Generate recommendations
+        recommendations = self._generate_recommendations(
+            metrics,
+            missing_elements,
+            schema_opportunities
+        )
+
+        return AboutPageOptimizationResponse(
+            current_metrics=metrics,
+            missing_elements=missing_elements,
+            content_suggestions=content_suggestions,
+            schema_opportunities=schema_opportunities,
+            recommendations=recommendations,
+            analyzed_at=datetime.now()
+        )
+
     async def _get_about_content(
         self,
         site_url: str,
@@ -150,25 +753,23 @@ class AboutPageOptimizer:
     def _calculate_metrics(
         self,
         content: str,
-        site_data: Optional[Dict]
+        site_data: Optional[Dict],
+        content_lower: bytes,
+        trust_signals_count: int
     ) -> AboutPageMetrics:
         """Calculate About page quality metrics"""
-        # Word count
-        words = content.split()
-        word_count = len(words)
+        # Word count (the token list is dropped immediately rather than kept
+        # alive for the rest of the analysis)
+        word_count = len(content.split())
 
         # Entity mentions (business name repetition)
         entity_mentions = 0
         if site_data and site_data.get("business_name"):
-            business_name = site_data["business_name"]
-            entity_mentions = len(re.findall(
-                r'\b' + re.escape(business_name) + r'\b',
+            entity_mentions = _count_name_mentions(
+                site_data["business_name"],
                 content,
-                re.IGNORECASE
-            ))
-
-        # Trust signals count
-        trust_signals_count = self._count_trust_signals(content)
+                content_lower
+            )
 
         # Team members mentioned
         team_members_mentioned = self._count_team_members(content)
@@ -204,67 +805,125 @@ class AboutPageOptimizer:
             overall_quality_score=overall_quality_score
         )
 
-    def _count_trust_signals(self, content: str) -> int:
-        """Count trust signals in content"""
-        content_lower = content.lower()
-        count = 0
+    def _scan_keywords(self, content_lower: bytes) -> Tuple[int, int]:
+        """
+        Scan lowercased UTF-8 content for trust signals and missing-element
+        probes in one pass
 
-        for category, signals in self.trust_signals.items():
-            for signal in signals:
-                if signal in content_lower:
-                    count += 1
+        The probe bitmask only matches str regex semantics for ASCII content
+        (ASCII-only \b and lowercasing); callers probe other content with
+        _scan_probes_text.
 
-        return count
+        Returns:
+            (distinct trust signal phrases found, MissingElement probe bitmask)
+        """
+        probe_count = len(_MISSING_PROBES)
+
+        if self._keyword_db is not None:
+            found = 0
+            signals = set()
+
+            def on_match(pattern_id, start, end, flags, context):
+                nonlocal found
+                if pattern_id < probe_count:
+                    found |= _MISSING_PROBE_MASKS[pattern_id]
+                else:
+                    signals.add(pattern_id)
+
+            self._keyword_db.scan(content_lower, match_event_handler=on_match)
+            return len(signals), found
+
+        if self._trust_automaton is not None:
+            # Aho-Corasick reports overlapping matches too ("certified" inside
+            # "board certified"), matching the substring semantics below.
+            # Latin-1 maps bytes 1:1 to characters, so ASCII phrases match as-is
+            text = content_lower.decode("latin-1")
+            last = len(text) - 1
+            found = 0
+            signals = set()
+            for end, (size, index, mask) in self._trust_automaton.iter(text):
+                if index >= 0:
+                    signals.add(index)
+                if mask and (found & mask) != mask:
+                    start = end - size + 1
+                    if (
+                        (start == 0 or text[start - 1] not in _ASCII_WORD_CHARS)
+                        and (end == last or text[end + 1] not in _ASCII_WORD_CHARS)
+                    ):
+                        found |= mask
+            return len(signals), found
+
+        trust_signals_count = sum(1 for signal in _TRUST_SIGNAL_BYTES if signal in content_lower)
+
+        # Which keyword probes are present; stop scanning once all have matched
+        found = 0
+        for match in self._MISSING_PROBES_RE.finditer(content_lower):
+            found |= self._MISSING_PROBE_GROUPS[match.lastgroup]
+            if found == _MISSING_PROBE_ALL:
+                break
+
+        return trust_signals_count, found
+
+    def _scan_probes_text(self, content: str) -> int:
+        """MissingElement probe bitmask for content with non-ASCII characters"""
+        found = 0
+        for match in self._MISSING_PROBES_TEXT_RE.finditer(content):
+            found |= self._MISSING_PROBE_GROUPS[match.lastgroup]
+            if found == _MISSING_PROBE_ALL:
+                break
+        return found
 
     def _count_team_members(self, content: str) -> int:
         """Count team member mentions"""
-        # Look for common patterns
-        patterns = [
-            r'\b[A-Z][a-z]+\s+[A-Z][a-z]+,\s+(?:CEO|CTO|CFO|Founder|Director|Manager)',
-            r'(?:CEO|CTO|CFO|Founder|Director|Manager):\s+[A-Z][a-z]+\s+[A-Z][a-z]+',
-            r'\b(?:our|the)\s+(?:CEO|founder|director|manager|president)',
-        ]
-
-        count = 0
-        for pattern in patterns:
-            matches = re.findall(pattern, content)
-            count += len(matches)
-
-        return min(count, 20)  # Cap at reasonable number
+        return self._count_capped(self._TEAM_PATTERNS, content, 20)
 
     def _count_achievements(self, content: str) -> int:
         """Count achievement mentions"""
-        achievement_patterns = [
-            r'\b(?:won|received|earned|awarded)\s+(?:the\s+)?[A-Z][a-zA-Z\s]+(?:Award|Prize|Recognition)',
-            r'\b[A-Z][a-zA-Z\s]+(?:Award|Prize)\b',
-            r'\b(?:top|best|leading|premier)\s+\w+\b',
-        ]
+        return self._count_capped(self._ACHIEVEMENT_PATTERNS, content, 15)
 
+    @staticmethod
+    def _count_capped(patterns, content: str, cap: int) -> int:
+        """Count matches across patterns, stopping once the cap is reached"""
         count = 0
-        for pattern in achievement_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            count += len(matches)
+        for pattern in patterns:
+            for _ in pattern.finditer(content):
+                count += 1
+                if count >= cap:
+                    return cap
 
-        return min(count, 15)  # Cap at reasonable number
+        return count
 
     def _check_contact_info(
         self,
         content: str,
         site_data: Optional[Dict]
     ) -> bool:
-        """Check if contact information is complete"""
-        has_phone = bool(re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', content))
-        has_email = bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', content))
-        has_address = bool(re.search(r'\b\d+\s+\w+\s+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)\b', content, re.IGNORECASE))
+        """Check if contact information is complete (at least 2 of 3)"""
+        has_phone = has_email = has_address = False
 
-        # Also check site_data
+        # site_data is a dict lookup; only fall back to the regexes for
+        # signals it does not already supply
         if site_data:
-            has_phone = has_phone or bool(site_data.get("phone"))
-            has_email = has_email or bool(site_data.get("email"))
-            has_address = has_address or bool(site_data.get("address"))
-
-        # Need at least 2 of 3
-        return sum([has_phone, has_email, has_address]) >= 2
+            has_phone = bool(site_data.get("phone"))
+            has_email = bool(site_data.get("email"))
+            has_address = bool(site_data.get("address"))
+
+        found = has_phone + has_email + has_address
+        if found >= 2:
+            return True
+
+        # Cheapest pattern first; the address pattern backtracks the most
+        for has, pattern in (
+            (has_phone, self._CONTACT_PHONE_RE),
+            (has_email, self._CONTACT_EMAIL_RE),
+            (has_address, self._CONTACT_ADDRESS_RE),
+        ):
+            if not has and pattern.search(content):
+                found += 1
+                if found >= 2:
+                    return True
+
+        return False
 
     def _calculate_quality_score(
         self,
@@ -277,214 +936,79 @@ class AboutPageOptimizer:
         visual_content: int
     ) -> int:
         """Calculate overall quality score (0-100)"""
-        score = 0
-
-        # Word count score (0-25 points)
-        if word_count >= 800:
-            score += 25
-        elif word_count >= 500:
-            score += 20
-        elif word_count >= 300:
-            score += 15
-        elif word_count >= 150:
-            score += 10
-        else:
-            score += 5
-
-        # Entity mentions score (0-15 points)
-        if entity_mentions >= 5:
-            score += 15
-        elif entity_mentions >= 3:
-            score += 12
-        elif entity_mentions >= 1:
-            score += 8
-        else:
-            score += 0
-
-        # Trust signals score (0-20 points)
-        if trust_signals >= 10:
-            score += 20
-        elif trust_signals >= 6:
-            score += 15
-        elif trust_signals >= 3:
-            score += 10
-        else:
-            score += 5
-
-        # Team members score (0-15 points)
-        if team_members >= 5:
-            score += 15
-        elif team_members >= 3:
-            score += 12
-        elif team_members >= 1:
-            score += 8
-        else:
-            score += 0
-
-        # Achievements score (0-10 points)
-        if achievements >= 5:
-            score += 10
-        elif achievements >= 3:
-            score += 7
-        elif achievements >= 1:
-            score += 4
-        else:
-            score += 0
-
-        # Contact info score (0-10 points)
-        if contact_complete:
-            score += 10
-
-        # Visual content score (0-5 points)
-        if visual_content >= 5:
-            score += 5
-        elif visual_content >= 3:
-            score += 4
-        elif visual_content >= 1:
-            score += 2
-
-        return min(100, score)
+        return _score(
+            word_count,
+            entity_mentions,
+            trust_signals,
+            team_members,
+            achievements,
+            contact_complete,
+            visual_content
+        )
 
     def _identify_missing_elements(
         self,
-        content: str,
+        found: int,
         metrics: AboutPageMetrics
-    ) -> List[str]:
-        """Identify missing content elements"""
+    ) -> List[MissingElement]:
+        """Identify missing content elements (found: probe bitmask from _scan_keywords)"""
         missing = []
 
         # Check for origin story
-        if not re.search(r'\b(?:founded|started|began|established|origin|history)\b', content, re.IGNORECASE):
-            missing.append("Origin story or company history")
+        if not found & MissingElement.ORIGIN.bit:
+            missing.append(MissingElement.ORIGIN)
 
         # Check for mission/vision
-        if not re.search(r'\b(?:mission|vision|purpose|why we|believe)\b', content, re.IGNORECASE):
-            missing.append("Mission, vision, or purpose statement")
+        if not found & MissingElement.MISSION.bit:
+            missing.append(MissingElement.MISSION)
 
         # Check for team information
         if metrics.team_members_mentioned == 0:
-            missing.append("Team member profiles or bios")
+            missing.append(MissingElement.TEAM)
 
         # Check for credentials
-        if not re.search(r'\b(?:certified|licensed|qualified|credentials|education)\b', content, re.IGNORECASE):
-            missing.append("Professional credentials or certifications")
+        if not found & MissingElement.CREDENTIALS.bit:
+            missing.append(MissingElement.CREDENTIALS)
 
         # Check for contact info
         if not metrics.contact_info_complete:
-            missing.append("Complete contact information (phone, email, address)")
+            missing.append(MissingElement.CONTACT)
 
         # Check for achievements
         if metrics.achievements_mentioned == 0:
-            missing.append("Awards, achievements, or notable milestones")
+            missing.append(MissingElement.ACHIEVEMENTS)
 
         # Check for experience indicators
-        if not re.search(r'\b(?:years|since|experience|established)\b', content, re.IGNORECASE):
-            missing.append("Years of experience or founding date")
+        if not found & MissingElement.EXPERIENCE.bit:
+            missing.append(MissingElement.EXPERIENCE)
 
         # Check for value proposition
-        if not re.search(r'\b(?:unique|different|why choose|our approach|what sets us)\b', content, re.IGNORECASE):
-            missing.append("Unique value proposition or differentiators")
+        if not found & MissingElement.VALUE_PROP.bit:
+            missing.append(MissingElement.VALUE_PROP)
 
         # Check for service area
-        if not re.search(r'\b(?:serving|based in|located|area|region|local)\b', content, re.IGNORECASE):
-            missing.append("Service area or geographic location")
+        if not found & MissingElement.SERVICE_AREA.bit:
+            missing.append(MissingElement.SERVICE_AREA)
 
         # Check for visual content
         if metrics.visual_content_count == 0:
-            missing.append("Team photos, office images, or visual content")
+            missing.append(MissingElement.VISUAL)
 
         return missing
 
     def _generate_content_suggestions(
         self,
         content: str,
-        missing_elements: List[str],
+        missing_elements: List[MissingElement],
         metrics: AboutPageMetrics
     ) -> List[Dict[str, str]]:
         """Generate specific content suggestions"""
         suggestions = []
 
         # Suggest sections for missing elements
+        templates = self._SUGGESTION_TEMPLATES
         for element in missing_elements:
-            if "origin story" in element.lower():
-                suggestions.append({
-                    "section": "Company History",
-                    "content": "Add a section describing how and why your business was founded. Include the year, founder names, and the problem you set out to solve.",
-                    "priority": "high",
-                    "estimated_length": "150-250 words"
-                })
-
-            elif "mission" in element.lower():
-                suggestions.append({
-                    "section": "Mission & Values",
-                    "content": "Define your company's mission, core values, and what drives your work. Make it authentic and specific to your business.",
-                    "priority": "high",
-                    "estimated_length": "100-200 words"
-                })
-
-            elif "team" in element.lower():
-                suggestions.append({
-                    "section": "Our Team",
-                    "content": "Include profiles of key team members with names, titles, credentials, and brief bios. Add professional photos.",
-                    "priority": "high",
-                    "estimated_length": "50-100 words per person"
-                })
-
-            elif "credentials" in element.lower():
-                suggestions.append({
-                    "section": "Credentials & Certifications",
-                    "content": "List professional licenses, certifications, industry accreditations, and qualifications that establish your expertise.",
-                    "priority": "high",
-                    "estimated_length": "100-150 words"
-                })
-
-            elif "contact" in element.lower():
-                suggestions.append({
-                    "section": "Contact Information",
-                    "content": "Ensure your About page includes phone number, email address, and physical address (if applicable). Consider adding a contact form.",
-                    "priority": "high",
-                    "estimated_length": "N/A"
-                })
-
-            elif "achievements" in element.lower():
-                suggestions.append({
-                    "section": "Awards & Recognition",
-                    "content": "Highlight awards, industry recognition, notable clients, or significant milestones that demonstrate your credibility.",
-                    "priority": "medium",
-                    "estimated_length": "100-200 words"
-                })
-
-            elif "experience" in element.lower():
-                suggestions.append({
-                    "section": "Experience",
-                    "content": "Specify how long you've been in business, years of combined team experience, or number of projects completed.",
-                    "priority": "medium",
-                    "estimated_length": "50-100 words"
-                })
-
-            elif "value proposition" in element.lower():
-                suggestions.append({
-                    "section": "What Sets Us Apart",
-                    "content": "Clearly articulate what makes your business different from competitors. Focus on unique approaches, specializations, or guarantees.",
-                    "priority": "high",
-                    "estimated_length": "150-250 words"
-                })
-
-            elif "service area" in element.lower():
-                suggestions.append({
-                    "section": "Service Area",
-                    "content": "Clearly state your geographic service area, whether local, regional, or national. Important for local SEO.",
-                    "priority": "medium",
-                    "estimated_length": "50-100 words"
-                })
-
-            elif "visual content" in element.lower():
-                suggestions.append({
-                    "section": "Visual Elements",
-                    "content": "Add professional photos of your team, office/workspace, completed projects, or work in progress. Builds trust and engagement.",
-                    "priority": "medium",
-                    "estimated_length": "N/A"
-                })
+            suggestions.append(dict(templates[element]))
 
         # Length suggestions
         if metrics.word_count < 500:
@@ -509,36 +1033,54 @@ class AboutPageOptimizer:
     def _identify_schema_opportunities(
         self,
         content: str,
-        site_data: Optional[Dict]
+        site_data: Optional[Dict],
+        content_lower: bytes
     ) -> List[str]:
-        """Identify schema markup opportunities"""
+        """Identify schema markup opportunities (content_lower: lowercased UTF-8)"""
         opportunities = []
 
+        # A case-insensitive probe can only match if one of its words occurs
+        # in the lowercased content, so a substring test rules probes out and
+        # lets the scan stop as soon as every remaining probe has matched.
+        # Characters that IGNORECASE folds onto ASCII would defeat the
+        # substring test; skip it when any are present.
+        wanted = {"team", "timeline", "awards", "faq"}
+        if not any(char in content_lower for char in _ASCII_FOLDING_CHARS):
+            for name, keywords in self._SCHEMA_PROBE_KEYWORDS:
+                if not any(keyword in content_lower for keyword in keywords):
+                    wanted.discard(name)
+
+        found = set()
+        for match in self._SCHEMA_PROBES_RE.finditer(content):
+            found.add(match.lastgroup)
+            if found >= wanted:
+                break
+
         # Organization schema
         opportunities.append(
             "Add Organization schema with founding date, founder, number of employees"
         )
 
         # Check for team members
-        if re.search(r'\b(?:CEO|founder|director|team)\b', content, re.IGNORECASE):
+        if "team" in found:
             opportunities.append(
                 "Add Person schema for key team members with name, role, credentials"
             )
 
         # Check for timeline/milestones
-        if re.search(r'\b(?:founded|since|established|\d{4})\b', content):
+        if "timeline" in found:
             opportunities.append(
                 "Consider adding Event schema for company milestones"
             )
 
         # Check for awards
-        if re.search(r'\b(?:award|recognition|achievement)\b', content, re.IGNORECASE):
+        if "awards" in found:
             opportunities.append(
                 "Mark up awards and achievements with schema for enhanced visibility"
             )
 
         # FAQ schema if Q&A present
-        if re.search(r'\b(?:question|answer|faq|why|how|what)\b', content, re.IGNORECASE):
+        if "faq" in found:
             opportunities.append(
                 "Add FAQ schema if you have Q&A content on your About page"
             )
@@ -561,7 +1103,7 @@ class AboutPageOptimizer:
                 "category": "overall",
                 "title": "Excellent About Page",
                 "description": f"Your About page scores {metrics.overall_quality_score}/100. Focus on minor enhancements and schema markup.",
-                "action_items": []
+                "action_items": ()
             })
         elif metrics.overall_quality_score >= 60:
             recommendations.append({
@@ -569,7 +1111,7 @@ class AboutPageOptimizer:
                 "category": "overall",
                 "title": "Good About Page with Room for Improvement",
                 "description": f"Your About page scores {metrics.overall_quality_score}/100. Address the missing elements below to strengthen entity recognition.",
-                "action_items": []
+                "action_items": ()
             })
         else:
             recommendations.append({
@@ -577,7 +1119,7 @@ class AboutPageOptimizer:
                 "category": "overall",
                 "title": "About Page Needs Significant Improvement",
                 "description": f"Your About page scores {metrics.overall_quality_score}/100. This is a critical page for entity SEO - prioritize improvements.",
-                "action_items": []
+                "action_items": ()
             })
 
         # Content length recommendations
@@ -587,12 +1129,7 @@ class AboutPageOptimizer:
                 "category": "content",
                 "title": "Expand Content Length",
                 "description": f"At {metrics.word_count} words, your About page is too short. Aim for 500-1000 words.",
-                "action_items": [
-                    "Add detailed company history",
-                    "Include team member bios",
-                    "Expand on your unique value proposition",
-                    "Add more about your credentials and experience"
-                ]
+                "action_items": _CONTENT_LENGTH_ACTIONS
             })
 
         # Trust signals
@@ -602,12 +1139,7 @@ class AboutPageOptimizer:
                 "category": "trust",
                 "title": "Add More Trust Signals",
                 "description": f"Only {metrics.trust_signals_count} trust signals detected. Add credentials, experience indicators, and quality statements.",
-                "action_items": [
-                    "Mention years in business",
-                    "List certifications and licenses",
-                    "Include client testimonials or case studies",
-                    "Add team credentials and qualifications"
-                ]
+                "action_items": _TRUST_SIGNAL_ACTIONS
             })
 
         # Missing elements
@@ -637,12 +1169,7 @@ class AboutPageOptimizer:
                 "category": "team",
                 "title": "Add Team Information",
                 "description": "Team member profiles with credentials strengthen entity recognition and build trust.",
-                "action_items": [
-                    "Create profiles for founders and key team members",
-                    "Include names, titles, and credentials",
-                    "Add professional photos",
-                    "Mention relevant experience and expertise"
-                ]
+                "action_items": _TEAM_ACTIONS
             })
 
         # Contact information
@@ -652,12 +1179,7 @@ class AboutPageOptimizer:
                 "category": "contact",
                 "title": "Complete Contact Information",
                 "description": "Complete NAP (Name, Address, Phone) is critical for entity recognition.",
-                "action_items": [
-                    "Add phone number",
-                    "Add email address",
-                    "Add physical address (if applicable)",
-                    "Ensure consistency with other pages"
-                ]
+                "action_items": _CONTACT_ACTIONS
             })
 
         # Visual content
@@ -667,12 +1189,7 @@ class AboutPageOptimizer:
                 "category": "visual",
                 "title": "Add Visual Content",
                 "description": "Photos humanize your business and increase engagement.",
-                "action_items": [
-                    "Add team photos",
-                    "Include office/workspace images",
-                    "Show your work or products",
-                    "Add founder/leadership photos"
-                ]
+                "action_items": _VISUAL_ACTIONS
             })
 
         return recommendations
@@ -4,10 +4,20 @@ AI-powered business description optimization using GPT-4
 """
 
 import os
+import asyncio
+import hashlib
+import heapq
+import json
 import logging
-from typing import List, Dict, Optional, Tuple
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice, repeat
+from operator import itemgetter
 from openai import AsyncOpenAI
 
 from app.models.entity_models import (
@@ -18,6 +28,242 @@ from app.models.entity_models import (
 
 logger = logging.getLogger(__name__)
 
+# Caps concurrent GPT-4 requests across all generators in the process
+_GPT_SEM = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "10")))
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """
+    Shared OpenAI client, so generators reuse one connection pool
+
+    The SDK retries rate limits, timeouts and 5xx responses with
+    exponential backoff (3 attempts).
+    """
+    return AsyncOpenAI(api_key=api_key, max_retries=3, timeout=30)
+
+
+# In-process cache of GPT-4 variations keyed by request body digest, so
+# repeat generations for the same business skip the API call entirely
+_VARIATIONS_CACHE_TTL = 24 * 60 * 60
+_VARIATIONS_CACHE_MAX = 1024
+_variations_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _variations_cache_key(body: Dict) -> str:
+    """Digest of a chat completion request body"""
+    return hashlib.blake2b(
+        json.dumps(body, sort_keys=True).encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+
+
+def _get_cached_variations(key: str) -> Optional[List[str]]:
+    """Return cached variations for key, or None if missing/expired"""
+    entry = _variations_cache.get(key)
+    if entry is None:
+        return None
+
+    stored_at, variations = entry
+    if time.monotonic() - stored_at > _VARIATIONS_CACHE_TTL:
+        del _variations_cache[key]
+        return None
+
+    _variations_cache.move_to_end(key)
+    return list(variations)
+
+
+def _cache_variations(key: str, variations: List[str]) -> None:
+    """Store variations, evicting the least recently used entry when full"""
+    _variations_cache[key] = (time.monotonic(), tuple(variations))
+    _variations_cache.move_to_end(key)
+    if len(_variations_cache) > _VARIATIONS_CACHE_MAX:
+        _variations_cache.popitem(last=False)
+
+
+# Minimum descriptions per worker before scoring is spread across processes
+_PARALLEL_SCORE_MIN = 20000
+
+# Batch API statuses after which a batch no longer changes
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Scoring vocabulary, matched as substrings of the lowercased description
+# ("expert" also counts "expertise")
+_BUSINESS_TYPE_WORDS = frozenset(('services', 'company', 'business', 'provider', 'professional', 'expert'))
+_VALUE_WORDS = frozenset(('trusted', 'certified', 'licensed', 'expert', 'professional', 'quality', 'leading'))
+
+# Every scoring word once, so shared words are searched a single time
+_SCORING_WORDS = tuple(sorted(_BUSINESS_TYPE_WORDS | _VALUE_WORDS))
+
+# Common service indicators (matched against lowercased text). Each pattern
+# is paired with the literal words it needs: one word from every group must
+# occur in the text, or the pattern cannot match and its scan is skipped.
+_SERVICE_PATTERNS = tuple((re.compile(pattern), required) for pattern, required in (
+    (
+        r'((?:professional|expert|certified)\s+\w+\s+(?:services?|solutions?))',
+        (("professional", "expert", "certified"), ("service", "solution")),
+    ),
+    (
+        r'((?:residential|commercial)\s+\w+)',
+        (("residential", "commercial"),),
+    ),
+    (
+        r'(\w+\s+(?:repair|maintenance|installation|restoration|cleaning))',
+        (("repair", "maintenance", "installation", "restoration", "cleaning"),),
+    ),
+))
+
+# Candidate keywords: lowercase words of 4+ letters
+_KEYWORD_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Maps ASCII non-word characters (anything but [A-Za-z0-9_]) to spaces, so
+# splitting yields runs of word characters, with non-ASCII text left as is
+_NON_WORD_ASCII = str.maketrans({
+    char: " " for char in map(chr, range(128)) if not (char.isalnum() or char == "_")
+})
+
+
+def _iter_keyword_candidates(text_lower: str) -> Iterator[str]:
+    """
+    Yield the _KEYWORD_RE matches of lowercased text, in order
+
+    ASCII tokens are checked with str methods; only tokens containing
+    non-ASCII characters go through the regex, whose word boundaries then
+    fall at the same places as in the full text.
+    """
+    for token in text_lower.translate(_NON_WORD_ASCII).split():
+        if token.isascii():
+            if len(token) >= 4 and token.isalpha():
+                yield token
+        else:
+            yield from _KEYWORD_RE.findall(token)
+
+
+# Common words excluded from keyword extraction
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during'
+})
+
+# "City, ST" / "City Name ST" location mentions
+_LOCATION_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),?\s+([A-Z]{2})\b')
+
+
+def _score_variation(
+    description: str,
+    keyword_terms: List[Tuple[str, str]],
+    location_lower: Optional[str],
+    min_length: int,
+    max_length: int
+) -> BusinessDescriptionVariation:
+    """Score one variation (keyword_terms: (keyword, lowercased keyword) pairs)"""
+    char_count = len(description)
+    desc_lower = description.lower()
+
+    # SEO score (keyword presence, length, structure)
+    seo_score = 0
+    keywords_included = []
+
+    for keyword, keyword_lower in keyword_terms:
+        if keyword_lower in desc_lower:
+            seo_score += 15
+            keywords_included.append(keyword)
+
+    # Length score
+    if min_length <= char_count <= max_length:
+        seo_score += 25
+    elif char_count < min_length:
+        seo_score += 10
+    else:
+        seo_score += 15
+
+    # Has proper structure (business name + description)
+    if any(char.isupper() for char in description[:30]):  # Business name likely capitalized
+        seo_score += 10
+
+    seo_score = min(100, seo_score)
+
+    # Local relevance score
+    local_score = 0
+    location_mentioned = False
+
+    if location_lower is not None:
+        if location_lower in desc_lower:
+            local_score = 100
+            location_mentioned = True
+        else:
+            local_score = 30  # Penalize missing location
+    else:
+        local_score = 50  # Neutral if no location provided
+
+    # Entity clarity score
+    entity_score = 50  # Base score
+
+    # One pass over the scoring vocabulary, bucketed below
+    present = {word for word in _SCORING_WORDS if word in desc_lower}
+
+    # Has business type/industry mention
+    if not _BUSINESS_TYPE_WORDS.isdisjoint(present):
+        entity_score += 20
+
+    # Has clear value proposition
+    value_count = len(present & _VALUE_WORDS)
+    entity_score += min(30, value_count * 10)
+
+    entity_score = min(100, entity_score)
+
+    # Readability score
+    readability = 50  # Base
+
+    # Sentence count (three C-level str.count scans beat a single Python-level pass)
+    sentences = description.count('.') + description.count('!') + description.count('?')
+    if 2 <= sentences <= 4:
+        readability += 25
+    elif sentences == 1:
+        readability += 15
+
+    # Average word length
+    words = description.split()
+    avg_word_len = sum(len(w) for w in words) / len(words) if words else 0
+    if 4 <= avg_word_len <= 7:
+        readability += 25
+
+    readability = min(100, readability)
+
+    # Overall score (weighted average)
+    overall = int(
+        seo_score * 0.35 +
+        local_score * 0.25 +
+        entity_score * 0.25 +
+        readability * 0.15
+    )
+
+    return BusinessDescriptionVariation(
+        description=description,
+        character_count=char_count,
+        seo_score=seo_score,
+        local_relevance_score=local_score,
+        entity_clarity_score=entity_score,
+        readability_score=readability,
+        overall_score=overall,
+        keywords_included=keywords_included,
+        location_mentioned=location_mentioned
+    )
+
+
+def _score_chunk(
+    descriptions: List[str],
+    keyword_terms: List[Tuple[str, str]],
+    location_lower: Optional[str],
+    min_length: int,
+    max_length: int
+) -> List[BusinessDescriptionVariation]:
+    """Score a chunk of variations in a pool worker (module-level so it pickles)"""
+    return [
+        _score_variation(description, keyword_terms, location_lower, min_length, max_length)
+        for description in descriptions
+    ]
+
 
 class BusinessDescriptionGenerator:
     """Generate entity-optimized business descriptions"""
@@ -29,7 +275,7 @@ class BusinessDescriptionGenerator:
             logger.warning("OPENAI_API_KEY not set - GPT-4 features will use fallback")
             self.client = None
         else:
-            self.client = AsyncOpenAI(api_key=api_key)
+            self.client = _get_client(api_key)
 
         self.max_description_length = 200
         self.min_description_length = 150
@@ -49,13 +295,13 @@ class BusinessDescriptionGenerator:
         """
         try:
             # Step 1: Analyze existing content
-            analysis = await self._analyze_existing_content(request)
+            analysis = self._analyze_existing_content(request)
 
             # Step 2: Identify business type
-            business_type = await self._identify_business_type(analysis, request)
+            business_type = self._identify_business_type(analysis, request)
 
             # Step 3: Extract location info
-            location_info = await self._extract_location_info(analysis, request)
+            location_info = self._extract_location_info(analysis, request)
 
             # Step 4: Generate optimized descriptions
             variations = await self._generate_variations(
@@ -65,44 +311,215 @@ class BusinessDescriptionGenerator:
                 request
             )
 
-            # Step 5: Score each variation
-            scored_variations = []
-            for desc in variations:
-                scored_var = await self._score_description(
-                    desc,
-                    request.target_keywords or [],
-                    location_info
-                )
-                scored_variations.append(scored_var)
-
-            # Sort by overall score
-            scored_variations.sort(key=lambda x: x.overall_score, reverse=True)
-
-            # Generate recommendations
-            recommendations = self._generate_recommendations(
-                scored_variations,
+            # Step 5: Score variations and build the response
+            return self._build_response(
+                request,
                 analysis,
-                business_type
-            )
-
-            return BusinessDescriptionResponse(
-                variations=scored_variations,
-                analysis={
-                    "business_type": business_type,
-                    "location": location_info,
-                    "existing_description": request.existing_description,
-                    "detected_services": analysis.get("services", []),
-                    "detected_keywords": analysis.get("keywords", [])
-                },
-                recommendations=recommendations,
-                generated_at=datetime.now()
+                business_type,
+                location_info,
+                variations
             )
 
         except Exception as e:
             logger.error(f"Error generating descriptions: {str(e)}")
             raise
 
-    async def _analyze_existing_content(
+    async def generate_descriptions_batch(
+        self,
+        requests: List[BusinessDescriptionRequest],
+        poll_interval: float = 30.0,
+        max_wait: float = 24 * 3600
+    ) -> List[BusinessDescriptionResponse]:
+        """
+        Generate optimized business descriptions for many businesses via the
+        OpenAI Batch API
+
+        Batch requests cost half as much and have separate rate limits, but
+        complete asynchronously (within 24h), so this suits offline bulk
+        runs rather than interactive requests. Requests the batch does not
+        answer fall back to template generation.
+
+        Args:
+            requests: Business description generation requests
+            poll_interval: Seconds between batch status checks
+            max_wait: Maximum seconds to wait for the batch to finish
+
+        Returns:
+            Responses in the same order as requests
+        """
+        if not self.client:
+            return [await self.generate_descriptions(request) for request in requests]
+
+        try:
+            prepared = []
+            for request in requests:
+                analysis = self._analyze_existing_content(request)
+                business_type = self._identify_business_type(analysis, request)
+                location_info = self._extract_location_info(analysis, request)
+                prepared.append((analysis, business_type, location_info))
+
+            # Cached requests skip the batch; the rest get one JSONL line
+            # each, with the request's index as custom_id
+            outputs: Dict[str, List[str]] = {}
+            lines = []
+            cache_keys = {}
+            for index, (analysis, business_type, location_info) in enumerate(prepared):
+                body = self._gpt4_request_body(analysis, business_type, location_info)
+                cache_key = _variations_cache_key(body)
+                cached = _get_cached_variations(cache_key)
+                if cached is not None:
+                    outputs[str(index)] = cached
+                    continue
+                cache_keys[str(index)] = cache_key
+                lines.append(json.dumps({
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }))
+
+            if lines:
+                try:
+                    fresh = await self._run_batch(
+                        "\n".join(lines).encode("utf-8"),
+                        poll_interval,
+                        max_wait
+                    )
+                except Exception as e:
+                    logger.warning(f"GPT-4 batch generation failed: {str(e)}, using templates")
+                    fresh = {}
+
+                for custom_id, variations in fresh.items():
+                    if variations and custom_id in cache_keys:
+                        _cache_variations(cache_keys[custom_id], variations)
+                        outputs[custom_id] = variations
+
+            # One timestamp for the whole batch; every response completed together
+            generated_at = datetime.now()
+            responses = []
+            for index, (request, (analysis, business_type, location_info)) in enumerate(
+                zip(requests, prepared)
+            ):
+                variations = outputs.get(str(index)) or self._generate_with_templates(
+                    analysis,
+                    business_type,
+                    location_info,
+                    request
+                )
+                responses.append(self._build_response(
+                    request,
+                    analysis,
+                    business_type,
+                    location_info,
+                    variations[:5],
+                    generated_at
+                ))
+
+            return responses
+
+        except Exception as e:
+            logger.error(f"Error generating descriptions batch: {str(e)}")
+            raise
+
+    async def _run_batch(
+        self,
+        payload: bytes,
+        poll_interval: float,
+        max_wait: float
+    ) -> Dict[str, List[str]]:
+        """
+        Upload a JSONL batch of chat completion requests, wait for it to
+        finish, and parse the output
+
+        Returns:
+            Selected variations keyed by custom_id (failed requests omitted)
+        """
+        batch_file = await self.client.files.create(
+            file=("descriptions.jsonl", payload),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted description batch {batch.id}")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            if loop.time() >= deadline:
+                await self.client.batches.cancel(batch.id)
+                raise TimeoutError(f"Batch {batch.id} did not finish within {max_wait}s")
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        content = await self.client.files.content(batch.output_file_id)
+
+        outputs = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            variations = [
+                message["content"].strip()
+                for message in (
+                    choice.get("message") or {}
+                    for choice in response.get("body", {}).get("choices", [])
+                )
+                if message.get("content") and message["content"].strip()
+            ]
+            outputs[record["custom_id"]] = self._select_variations(variations)
+
+        return outputs
+
+    def _build_response(
+        self,
+        request: BusinessDescriptionRequest,
+        analysis: Dict,
+        business_type: str,
+        location_info: Optional[str],
+        variations: List[str],
+        generated_at: Optional[datetime] = None
+    ) -> BusinessDescriptionResponse:
+        """Score variations and assemble the response"""
+        # Score each variation (pure CPU work, no awaits needed)
+        scored_variations = self._score_descriptions_batch(
+            variations,
+            request.target_keywords or [],
+            location_info
+        )
+
+        # Sort by overall score
+        scored_variations.sort(key=lambda x: x.overall_score, reverse=True)
+
+        # Generate recommendations
+        recommendations = self._generate_recommendations(
+            scored_variations,
+            analysis,
+            business_type
+        )
+
+        return BusinessDescriptionResponse(
+            variations=scored_variations,
+            analysis={
+                "business_type": business_type,
+                "location": location_info,
+                "existing_description": request.existing_description,
+                "detected_services": analysis.get("services", []),
+                "detected_keywords": analysis.get("keywords", [])
+            },
+            recommendations=recommendations,
+            generated_at=generated_at or datetime.now()
+        )
+
+    def _analyze_existing_content(
         self,
         request: BusinessDescriptionRequest
     ) -> Dict:
@@ -131,39 +548,27 @@ class BusinessDescriptionGenerator:
     def _extract_services(self, text: str) -> List[str]:
         """Extract service mentions from text"""
         services = []
+        text_lower = text.lower()
 
-        # Common service indicators
-        service_patterns = [
-            r'((?:professional|expert|certified)\s+\w+\s+(?:services?|solutions?))',
-            r'((?:residential|commercial)\s+\w+)',
-            r'(\w+\s+(?:repair|maintenance|installation|restoration|cleaning))',
-        ]
-
-        for pattern in service_patterns:
-            matches = re.findall(pattern, text.lower())
-            services.extend(matches)
+        for pattern, required in _SERVICE_PATTERNS:
+            if all(any(word in text_lower for word in words) for words in required):
+                services.extend(pattern.findall(text_lower))
 
         return list(set(services))[:5]  # Top 5 unique services
 
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from text"""
-        # Remove common words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during'
-        }
-
-        words = re.findall(r'\b[a-z]{4,}\b', text.lower())
-        keywords = [w for w in words if w not in stop_words]
+        # Count frequency, skipping common words
+        word_counts: Dict[str, int] = {}
+        for word in _iter_keyword_candidates(text.lower()):
+            if word not in _STOP_WORDS:
+                word_counts[word] = word_counts.get(word, 0) + 1
 
-        # Count frequency
-        from collections import Counter
-        word_counts = Counter(keywords)
+        # Return top 10 most common (ties keep first-seen order, as
+        # Counter.most_common does)
+        return [word for word, _ in heapq.nlargest(10, word_counts.items(), key=itemgetter(1))]
 
-        # Return top 10 most common
-        return [word for word, _ in word_counts.most_common(10)]
-
-    async def _identify_business_type(
+    def _identify_business_type(
         self,
         analysis: Dict,
         request: BusinessDescriptionRequest
@@ -187,7 +592,7 @@ class BusinessDescriptionGenerator:
 
         return "professional services"
 
-    async def _extract_location_info(
+    def _extract_location_info(
         self,
         analysis: Dict,
         request: BusinessDescriptionRequest
@@ -199,8 +604,7 @@ class BusinessDescriptionGenerator:
         # Try to extract from existing description
         if request.existing_description:
             # Look for city, state patterns
-            location_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),?\s+([A-Z]{2})\b'
-            match = re.search(location_pattern, request.existing_description)
+            match = _LOCATION_RE.search(request.existing_description)
             if match:
                 return f"{match.group(1)}, {match.group(2)}"
 
@@ -252,11 +656,42 @@ class BusinessDescriptionGenerator:
         request: BusinessDescriptionRequest
     ) -> List[str]:
         """Generate descriptions using GPT-4"""
+        body = self._gpt4_request_body(analysis, business_type, location)
+
+        # Reuse previous GPT-4 variations for an identical request
+        cache_key = _variations_cache_key(body)
+        cached = _get_cached_variations(cache_key)
+        if cached is not None:
+            logger.info("Using cached GPT-4 descriptions")
+            return cached
+
+        async with _GPT_SEM:
+            response = await self.client.chat.completions.create(**body)
+
+        variations = [
+            choice.message.content.strip()
+            for choice in response.choices
+            if choice.message.content and choice.message.content.strip()
+        ]
+
+        variations = self._select_variations(variations)
+        if variations:
+            _cache_variations(cache_key, variations)
+
+        return variations
+
+    def _gpt4_request_body(
+        self,
+        analysis: Dict,
+        business_type: str,
+        location: Optional[str]
+    ) -> Dict:
+        """Chat completion parameters for generating description variations"""
         business_name = analysis["business_name"]
         services = analysis.get("services", [])
         keywords = analysis.get("keywords", [])
 
-        prompt = f"""Generate 5 SEO-optimized business descriptions for entity recognition.
+        prompt = f"""Write one SEO-optimized business description for entity recognition.
 
 Business Information:
 - Name: {business_name}
@@ -266,7 +701,7 @@ Business Information:
 - Keywords: {', '.join(keywords[:5]) if keywords else 'None'}
 
 Requirements:
-1. Each description should be 150-200 characters
+1. The description should be 150-200 characters
 2. Include business name and type clearly
 3. Mention location if provided (important for local SEO)
 4. Include 1-2 primary services/keywords
@@ -274,11 +709,13 @@ Requirements:
 6. Optimize for Google entity recognition
 7. Make it compelling and clear
 
-Generate 5 different variations, each on a new line, no numbering."""
+Return only the description text, on a single line."""
 
-        response = await self.client.chat.completions.create(
-            model="gpt-4",
-            messages=[
+        # n=5 samples the variations as independent choices, which the
+        # server decodes in parallel and which need no line splitting
+        return {
+            "model": "gpt-4",
+            "messages": [
                 {
                     "role": "system",
                     "content": "You are an expert SEO copywriter specializing in entity optimization and local search."
@@ -288,14 +725,13 @@ Generate 5 different variations, each on a new line, no numbering."""
                     "content": prompt
                 }
             ],
-            temperature=0.7,
-            max_tokens=800
-        )
-
-        content = response.choices[0].message.content
-        variations = [line.strip() for line in content.split('\n') if line.strip()]
+            "n": 5,
+            "temperature": 0.7,
+            "max_tokens": 200
+        }
 
-        # Filter to valid lengths
+    def _select_variations(self, variations: List[str]) -> List[str]:
+        """Keep variations of a valid length (all of the first 5 if none are)"""
         valid_variations = [
             v for v in variations
             if self.min_description_length <= len(v) <= self.max_description_length
@@ -311,12 +747,23 @@ Generate 5 different variations, each on a new line, no numbering."""
         request: BusinessDescriptionRequest
     ) -> List[str]:
         """Generate descriptions using templates (fallback)"""
+        return list(islice(
+            self._iter_templates(analysis, business_type, location, request),
+            5
+        ))
+
+    def _iter_templates(
+        self,
+        analysis: Dict,
+        business_type: str,
+        location: Optional[str],
+        request: BusinessDescriptionRequest
+    ) -> Iterator[str]:
+        """Yield template descriptions lazily, so callers build only what they take"""
         business_name = analysis["business_name"]
         services = analysis.get("services", [])[:2]  # Top 2 services
         keywords = analysis.get("keywords", [])[:2]  # Top 2 keywords
 
-        variations = []
-
         # Template 1: Standard entity description
         if location:
             desc1 = f"{business_name} - Professional {business_type} in {location}. " \
@@ -326,7 +773,7 @@ Generate 5 different variations, each on a new line, no numbering."""
             desc1 = f"{business_name} - Leading {business_type} provider. " \
                    f"Specializing in {', '.join(services[:2]) if services else 'quality solutions'}. " \
                    f"Professional, certified, and experienced."
-        variations.append(desc1)
+        yield desc1
 
         # Template 2: Service-focused
         if services:
@@ -339,14 +786,14 @@ Generate 5 different variations, each on a new line, no numbering."""
                    f"{f' in {location}' if location else ''}. " \
                    f"Professional solutions with guaranteed satisfaction. " \
                    f"Licensed and insured."
-        variations.append(desc2)
+        yield desc2
 
         # Template 3: Authority-focused
         desc3 = f"Trusted {business_type}: {business_name}" \
                f"{f' serving {location}' if location else ''}. " \
                f"Years of experience, certified professionals, " \
                f"{'specializing in ' + services[0] if services else 'comprehensive solutions'}."
-        variations.append(desc3)
+        yield desc3
 
         # Template 4: Value proposition
         if location:
@@ -357,7 +804,7 @@ Generate 5 different variations, each on a new line, no numbering."""
             desc4 = f"Professional {business_type} - {business_name}. " \
                    f"Industry-leading expertise in {services[0] if services else 'comprehensive solutions'}. " \
                    f"Certified professionals, guaranteed results."
-        variations.append(desc4)
+        yield desc4
 
         # Template 5: Keyword-rich
         keywords_str = ', '.join(keywords[:3]) if keywords else business_type
@@ -365,107 +812,59 @@ Generate 5 different variations, each on a new line, no numbering."""
                f"{f' in {location}' if location else ''}. " \
                f"Professional {business_type} with certified expertise. " \
                f"Quality service and customer satisfaction guaranteed."
-        variations.append(desc5)
-
-        return variations
+        yield desc5
 
-    async def _score_description(
+    def _score_description(
         self,
         description: str,
         keywords: List[str],
         location: Optional[str]
     ) -> BusinessDescriptionVariation:
         """Score a description variation"""
-        char_count = len(description)
-
-        # SEO score (keyword presence, length, structure)
-        seo_score = 0
-        keywords_included = []
-
-        for keyword in keywords:
-            if keyword.lower() in description.lower():
-                seo_score += 15
-                keywords_included.append(keyword)
-
-        # Length score
-        if self.min_description_length <= char_count <= self.max_description_length:
-            seo_score += 25
-        elif char_count < self.min_description_length:
-            seo_score += 10
-        else:
-            seo_score += 15
+        return self._score_descriptions_batch([description], keywords, location)[0]
 
-        # Has proper structure (business name + description)
-        if any(char.isupper() for char in description[:30]):  # Business name likely capitalized
-            seo_score += 10
-
-        seo_score = min(100, seo_score)
+    def _score_descriptions_batch(
+        self,
+        descriptions: List[str],
+        keywords: List[str],
+        location: Optional[str]
+    ) -> List[BusinessDescriptionVariation]:
+        """
+        Score many description variations against the same keywords and
+        location, lowercasing those once for the whole batch. Batches of
+        at least 2 * _PARALLEL_SCORE_MIN are scored on a process pool.
 
-        # Local relevance score
-        local_score = 0
-        location_mentioned = False
+        Args:
+            descriptions: Description variations to score
+            keywords: Target keywords
+            location: Target location, if any
 
-        if location:
-            if location.lower() in description.lower():
-                local_score = 100
-                location_mentioned = True
-            else:
-                local_score = 30  # Penalize missing location
-        else:
-            local_score = 50  # Neutral if no location provided
-
-        # Entity clarity score
-        entity_score = 50  # Base score
-
-        # Has business type/industry mention
-        business_types = ['services', 'company', 'business', 'provider', 'professional', 'expert']
-        if any(bt in description.lower() for bt in business_types):
-            entity_score += 20
-
-        # Has clear value proposition
-        value_words = ['trusted', 'certified', 'licensed', 'expert', 'professional', 'quality', 'leading']
-        value_count = sum(1 for vw in value_words if vw in description.lower())
-        entity_score += min(30, value_count * 10)
-
-        entity_score = min(100, entity_score)
-
-        # Readability score
-        readability = 50  # Base
-
-        # Sentence count
-        sentences = description.count('.') + description.count('!') + description.count('?')
-        if 2 <= sentences <= 4:
-            readability += 25
-        elif sentences == 1:
-            readability += 15
-
-        # Average word length
-        words = description.split()
-        avg_word_len = sum(len(w) for w in words) / len(words) if words else 0
-        if 4 <= avg_word_len <= 7:
-            readability += 25
-
-        readability = min(100, readability)
-
-        # Overall score (weighted average)
-        overall = int(
-            seo_score * 0.35 +
-            local_score * 0.25 +
-            entity_score * 0.25 +
-            readability * 0.15
-        )
+        Returns:
+            Scored variations in the same order as descriptions
+        """
+        keyword_terms = [(keyword, keyword.lower()) for keyword in keywords]
+        location_lower = location.lower() if location else None
+        min_length = self.min_description_length
+        max_length = self.max_description_length
+
+        # Very large batches (e.g. candidate search) are split across a
+        # process pool, one chunk per worker
+        workers = min(os.cpu_count() or 1, len(descriptions) // _PARALLEL_SCORE_MIN)
+        if workers > 1:
+            size = -(-len(descriptions) // workers)
+            chunks = [descriptions[i:i + size] for i in range(0, len(descriptions), size)]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                scored = executor.map(
+                    _score_chunk,
+                    chunks,
+                    repeat(keyword_terms),
+                    repeat(location_lower),
+                    repeat(min_length),
+                    repeat(max_length)
+                )
+                return [variation for chunk in scored for variation in chunk]
 
-        return BusinessDescriptionVariation(
-            description=description,
-            character_count=char_count,
-            seo_score=seo_score,
-            local_relevance_score=local_score,
-            entity_clarity_score=entity_score,
-            readability_score=readability,
-            overall_score=overall,
-            keywords_included=keywords_included,
-            location_mentioned=location_mentioned
-        )
+        return _score_chunk(descriptions, keyword_terms, location_lower, min_length, max_length)
 
     def _generate_recommendations(
         self,
@@ -10,7 +10,7 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from urllib.parse import urlparse
 
-from .dataforseo_client import DataForSEOClient
+from .dataforseo_client import DataForSEOClient, TaskState
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,6 +30,10 @@ class SiteCrawler:
         self.max_poll_time = 600  # 10 minutes max wait
         logger.info("Site crawler initialized")
 
+    async def aclose(self):
+        """Close the DataForSEO client's HTTP session"""
+        await self.client.close()
+
     def _validate_url(self, url: str) -> str:
         """
         Validate and normalize URL
@@ -124,14 +128,14 @@ class SiteCrawler:
             # Note: /pages/ endpoint may 404 if crawl completed with 0 pages
             # In that case, get data from /summary/ instead
             try:
-                results = await self.client.task_get(task_id)
+                results = await self.client.task_get_raise(task_id)
                 logger.info("Retrieved crawl data from /pages/ endpoint")
             except Exception as e:
                 error_msg = str(e)
                 if "404" in error_msg:
                     logger.warning(f"/pages/ endpoint returned 404, using /summary/ data instead")
                     # Get summary data instead
-                    results = await self.client.task_status(task_id)
+                    results = await self.client.task_status_raise(task_id)
                     logger.info("Retrieved crawl data from /summary/ endpoint (0 pages crawled)")
                 else:
                     raise
@@ -174,7 +178,15 @@ class SiteCrawler:
             # Use task_status() method which uses /summary/ endpoint
             # This works during crawling, unlike /pages/ which only works when done
             try:
-                result = await self.client.task_status(task_id)
+                state, result = await self.client.task_status(task_id)
+
+                if state in (TaskState.IN_QUEUE, TaskState.IN_PROGRESS):
+                    logger.info("Task is still queued/processing")
+                    return "crawling"
+
+                if state == TaskState.ERROR:
+                    logger.error(f"Error checking task status: {result}")
+                    return "failed"
 
                 if result.get("tasks") and len(result["tasks"]) > 0:
                     task = result["tasks"][0]
@@ -207,11 +219,6 @@ class SiteCrawler:
             except Exception as direct_error:
                 error_msg = str(direct_error)
 
-                # Check for in-progress status markers
-                if "TASK_IN_QUEUE" in error_msg or "TASK_IN_PROGRESS" in error_msg:
-                    logger.info("Task is still queued/processing")
-                    return "crawling"
-
                 # 404 means task not ready yet (common during initial crawl setup)
                 if "404" in error_msg:
                     logger.info("Task not ready yet (404) - still setting up crawl")
@@ -469,6 +476,8 @@ async def test_crawler():
 
     except Exception as e:
         print(f"Crawl failed: {e}")
+    finally:
+        await crawler.aclose()
 
 
 if __name__ == "__main__":
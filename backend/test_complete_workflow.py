@@ -123,7 +123,7 @@ async def test_complete_workflow():
     print()
 
     try:
-        result = await client.task_get(task_id)
+        result = await client.task_get_raise(task_id)
 
         print("✅ Task retrieval SUCCESSFUL!")
         print()
@@ -36,7 +36,7 @@ async def test_endpoint_availability():
     # Test 1: /summary/ endpoint
     print("1. Testing /summary/ endpoint...")
     try:
-        result = await client.task_status(task_id)
+        result = await client.task_status_raise(task_id)
         print(f"   ✅ /summary/ AVAILABLE")
         if result.get("tasks") and result["tasks"][0].get("result"):
             crawl_result = result["tasks"][0]["result"][0]
@@ -59,7 +59,7 @@ async def test_endpoint_availability():
     # Test 2: /pages/ endpoint
     print("2. Testing /pages/ endpoint...")
     try:
-        result = await client.task_get(task_id)
+        result = await client.task_get_raise(task_id)
         print(f"   ✅ /pages/ AVAILABLE")
         if result.get("tasks") and result["tasks"][0].get("result"):
             crawl_result = result["tasks"][0]["result"][0]
@@ -91,7 +91,7 @@ async def test_endpoint_availability():
 
         # Try summary
         try:
-            result = await client.task_status(task_id)
+            result = await client.task_status_raise(task_id)
             if result.get("tasks") and result["tasks"][0].get("result"):
                 crawl_result = result["tasks"][0]["result"][0]
                 progress = crawl_result.get('crawl_progress')
@@ -102,7 +102,7 @@ async def test_endpoint_availability():
                 if progress == "finished":
                     print(f"  Crawl finished! Testing /pages/ endpoint...")
                     try:
-                        pages_result = await client.task_get(task_id)
+                        pages_result = await client.task_get_raise(task_id)
                         if pages_result.get("tasks") and pages_result["tasks"][0].get("result"):
                             items_count = len(pages_result["tasks"][0]["result"][0].get("items", []))
                             print(f"  /pages/ ✅ Retrieved {items_count} page items")
@@ -68,7 +68,7 @@ async def test_fresh_workflow():
 
                 # Try to get this task
                 try:
-                    result = await client.task_get(task_id)
+                    result = await client.task_get_raise(task_id)
 
                     if result.get("tasks") and len(result["tasks"]) > 0:
                         task_data = result["tasks"][0]
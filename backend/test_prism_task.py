@@ -29,7 +29,7 @@ async def test_prism_task():
     # Try to retrieve the task
     print("Attempting to retrieve task via /summary/ endpoint...")
     try:
-        result = await client.task_get(task_id)
+        result = await client.task_get_raise(task_id)
 
         print("✅ Task retrieval SUCCESSFUL!")
         print()
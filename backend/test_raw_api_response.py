@@ -37,7 +37,7 @@ async def inspect_raw_api():
     print()
     print("Step 2: Checking status via /summary/ endpoint...")
     try:
-        summary_response = await client.task_status(task_id)
+        summary_response = await client.task_status_raise(task_id)
         print("RAW /summary/ response:")
         print(json.dumps(summary_response, indent=2))
     except Exception as e:
@@ -46,7 +46,7 @@ async def inspect_raw_api():
     print()
     print("Step 3: Trying /pages/ endpoint...")
     try:
-        pages_response = await client.task_get(task_id)
+        pages_response = await client.task_get_raise(task_id)
         print("RAW /pages/ response:")
         print(json.dumps(pages_response, indent=2))
     except Exception as e:
@@ -62,7 +62,7 @@ async def inspect_raw_api():
         await asyncio.sleep(10)
 
         try:
-            summary = await client.task_status(task_id)
+            summary = await client.task_status_raise(task_id)
             result = summary["tasks"][0]["result"][0] if summary.get("tasks") and summary["tasks"][0].get("result") else {}
 
             progress = result.get("crawl_progress", "unknown")
@@ -82,7 +82,7 @@ async def inspect_raw_api():
                 # Try pages endpoint now
                 print("Attempting /pages/ endpoint...")
                 try:
-                    pages_resp = await client.task_get(task_id)
+                    pages_resp = await client.task_get_raise(task_id)
                     print("SUCCESS! /pages/ response:")
                     print(json.dumps(pages_resp, indent=2)[:2000])  # First 2000 chars
                 except Exception as e:
@@ -36,7 +36,7 @@ async def test_ready_task_retrieval():
 
         # Try to retrieve this task
         try:
-            result = await client.task_get(task_id)
+            result = await client.task_get_raise(task_id)
             print(f"  ✅ Retrieved successfully!")
 
             if result.get("tasks") and len(result["tasks"]) > 0:
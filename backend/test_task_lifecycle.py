@@ -45,7 +45,7 @@ async def test_task_lifecycle():
     # Step 2: Try to get task immediately
     print("Step 2: Trying to get task immediately after creation...")
     try:
-        result = await client.task_get(task_id)
+        result = await client.task_get_raise(task_id)
         print(f"✅ Success!")
         print(f"Response: {json.dumps(result, indent=2)}")
 
@@ -97,7 +97,7 @@ async def test_task_lifecycle():
 
         # Try task_get
         try:
-            result = await client.task_get(task_id)
+            result = await client.task_get_raise(task_id)
 
             if result.get("tasks") and len(result["tasks"]) > 0:
                 task = result["tasks"][0]
@@ -0,0 +1,211 @@
+"""
+Tests for the About page optimizer
+"""
+
+import asyncio
+import re
+
+import pytest
+
+from app.models.entity_models import AboutPageOptimizationRequest
+from app.services.entity import about_optimizer
+from app.services.entity.about_optimizer import AboutPageOptimizer
+
+
+ABOUT_CONTENT = """
+Founded in 2005, Acme Plumbing started as a family business with one van.
+Our mission is to deliver honest, reliable plumbing to every home in Austin.
+Meet our team of licensed and certified plumbers with 20 years of experience.
+We are proud members of the Better Business Bureau and have won several awards.
+Call us at (512) 555-0100 or email hello@acmeplumbing.com.
+"""
+
+
+# Keyword scan fixtures: overlapping signals, word boundaries, non-ASCII text
+SCAN_FIXTURES = [
+    "",
+    ABOUT_CONTENT,
+    "Board certified and licensed since 1998, serving the local area.",
+    "Teamwork, missionary, establishedness, founders, regional, unlocated, yearsago",
+    "Why we started: our approach is different. What sets us apart? Why choose us!",
+    "Café Ünïcode ß İstanbul — certified, büro, ESTABLISHED 1990 in the región",
+    "award-winning, top-rated, family-owned; _licensed_ and qualified-ish experts",
+    "éfounded in Zürich, ſince 1998 our miſsion is ſerving localé clients",
+]
+
+
+# Missing elements decided purely by the keyword probes
+PROBE_ELEMENTS = {
+    element for _, _, elements in about_optimizer._MISSING_PROBES for element in elements
+}
+
+
+def _reference_scan(content: str):
+    """Byte-level substring / regex scan the keyword backends must agree with"""
+    content_lower = content.lower().encode("utf-8")
+    trust_signals = sum(1 for signal in about_optimizer._TRUST_SIGNAL_BYTES if signal in content_lower)
+    found = 0
+    for (_, words, _), mask in zip(about_optimizer._MISSING_PROBES, about_optimizer._MISSING_PROBE_MASKS):
+        if re.search(rb"\b(?:" + words + rb")\b", content_lower, re.ASCII):
+            found |= mask
+    return trust_signals, found
+
+
+def _reference_analysis(content: str):
+    """
+    Trust signal count and missing elements with the original str semantics:
+    substring tests on content.lower() and one case-insensitive search per probe
+    """
+    content_lower = content.lower()
+    trust_signals = sum(
+        1 for _, signals in about_optimizer._TRUST_SIGNALS for signal in signals
+        if signal in content_lower
+    )
+    found = 0
+    for (_, words, _), mask in zip(about_optimizer._MISSING_PROBES, about_optimizer._MISSING_PROBE_MASKS):
+        if re.search(r"\b(?:" + words.decode() + r")\b", content, re.IGNORECASE):
+            found |= mask
+    missing = {
+        about_optimizer._MISSING_TEXT[element]
+        for element in PROBE_ELEMENTS
+        if not found & element.bit
+    }
+    return trust_signals, missing
+
+
+@pytest.fixture(params=["hyperscan", "ahocorasick", "regex"])
+def keyword_backend(request, monkeypatch):
+    """Force the About optimizer onto one keyword scan backend"""
+    backend = request.param
+    if backend != "regex" and getattr(about_optimizer, backend) is None:
+        pytest.skip(f"{backend} is not installed")
+    if backend != "hyperscan":
+        monkeypatch.setattr(about_optimizer, "hyperscan", None)
+    if backend == "regex":
+        monkeypatch.setattr(about_optimizer, "ahocorasick", None)
+    about_optimizer._keyword_matchers.cache_clear()
+    about_optimizer._analysis_cache.clear()
+    yield backend
+    about_optimizer._keyword_matchers.cache_clear()
+    about_optimizer._analysis_cache.clear()
+
+
+class TestKeywordBackends:
+    """Hyperscan, Aho-Corasick and regex keyword scans agree"""
+
+    @pytest.mark.parametrize("content", SCAN_FIXTURES)
+    def test_scan_matches_reference(self, keyword_backend, content):
+        optimizer = AboutPageOptimizer()
+        expected_db = keyword_backend == "hyperscan"
+        expected_automaton = keyword_backend == "ahocorasick"
+        assert (optimizer._keyword_db is not None) == expected_db
+        assert (optimizer._trust_automaton is not None) == expected_automaton
+
+        content_lower = content.lower().encode("utf-8")
+        assert optimizer._scan_keywords(content_lower) == _reference_scan(content)
+
+    @pytest.mark.parametrize("content", SCAN_FIXTURES)
+    def test_analysis_matches_reference(self, keyword_backend, content):
+        optimizer = AboutPageOptimizer()
+
+        result = optimizer._analyze(content, {"business_name": "Acme Plumbing"})
+
+        trust_signals, missing = _reference_analysis(content)
+        probe_texts = {about_optimizer._MISSING_TEXT[element] for element in PROBE_ELEMENTS}
+        assert result.current_metrics.trust_signals_count == trust_signals
+        assert probe_texts.intersection(result.missing_elements) == missing
+
+
+class TestNonAsciiContent:
+    """Missing-element probes on non-ASCII text keep str regex semantics"""
+
+    @pytest.mark.parametrize("content, present, missing", [
+        # "é" glued to a keyword is a word character; "ſ" (long s) folds to "s"
+        (
+            "éfounded in Zürich, ſince 1998 our miſsion is localé service",
+            ["Years of experience or founding date", "Mission, vision, or purpose statement"],
+            ["Origin story or company history", "Service area or geographic location"]
+        ),
+        (
+            "Acme Café was FOUNDED by Ana; we are ſerving the région — licensed since 2001",
+            ["Origin story or company history", "Service area or geographic location"],
+            ["Mission, vision, or purpose statement"]
+        ),
+    ])
+    def test_missing_elements(self, content, present, missing):
+        about_optimizer._analysis_cache.clear()
+        result = AboutPageOptimizer()._analyze(content, {"business_name": "Acme Café"})
+
+        for element in present:
+            assert element not in result.missing_elements
+        for element in missing:
+            assert element in result.missing_elements
+        assert result.current_metrics.entity_mentions == content.count("Acme Café")
+
+
+class TestAboutPageOptimizer:
+    """Test About page analysis"""
+
+    def setup_method(self):
+        about_optimizer._analysis_cache.clear()
+        self.optimizer = AboutPageOptimizer()
+        self.request = AboutPageOptimizationRequest(site_url="https://acmeplumbing.com")
+
+    def test_structured_address(self):
+        """A dict-valued address is accepted and counts as contact info"""
+        site_data = {
+            "about_content": ABOUT_CONTENT,
+            "business_name": "Acme Plumbing",
+            "address": {"street": "1 Main St", "city": "Austin", "state": "TX"}
+        }
+
+        result = asyncio.run(self.optimizer.optimize_about_page(self.request, site_data))
+        cached = asyncio.run(self.optimizer.optimize_about_page(self.request, dict(site_data)))
+
+        assert result.current_metrics.contact_info_complete
+        assert len(about_optimizer._analysis_cache) == 1
+        assert cached.model_dump(exclude={"analyzed_at"}) == result.model_dump(exclude={"analyzed_at"})
+
+    def test_batch_order_and_cache_reuse(self):
+        """Batch responses follow input order, match single analyses and reuse the cache"""
+        pages = [
+            {"about_content": ABOUT_CONTENT, "business_name": "Acme Plumbing"},
+            {"about_content": "We fix pipes.", "business_name": "Pipe Pros"},
+            {"about_content": ABOUT_CONTENT, "business_name": "Acme Plumbing"}
+        ]
+        items = [(self.request, site_data) for site_data in pages]
+
+        results = asyncio.run(self.optimizer.optimize_about_pages(items))
+
+        # Two distinct pages, analyzed once each
+        assert len(about_optimizer._analysis_cache) == 2
+        singles = [
+            asyncio.run(self.optimizer.optimize_about_page(self.request, site_data))
+            for site_data in pages
+        ]
+        assert len(about_optimizer._analysis_cache) == 2
+        assert [r.model_dump(exclude={"analyzed_at"}) for r in results] == [
+            r.model_dump(exclude={"analyzed_at"}) for r in singles
+        ]
+        assert results[0].current_metrics != results[1].current_metrics
+
+    def test_batch_process_pool(self, monkeypatch):
+        """Pool-analyzed batches match inline analyses"""
+        monkeypatch.setattr(about_optimizer, "_PARALLEL_ANALYSIS_MIN", 2)
+        monkeypatch.setattr(about_optimizer, "_POOL_WORKERS", 2)
+        items = [
+            (self.request, {"about_content": ABOUT_CONTENT + " " * i, "business_name": "Acme Plumbing"})
+            for i in range(3)
+        ]
+
+        try:
+            pooled = asyncio.run(self.optimizer.optimize_about_pages(items))
+        finally:
+            about_optimizer.shutdown_process_pool()
+
+        assert about_optimizer._process_pool is None
+        about_optimizer._analysis_cache.clear()
+        inline = [self.optimizer._analyze(site_data["about_content"], site_data) for _, site_data in items]
+        assert [r.model_dump(exclude={"analyzed_at"}) for r in pooled] == [
+            r.model_dump(exclude={"analyzed_at"}) for r in inline
+        ]
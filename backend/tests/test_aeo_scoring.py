@@ -130,6 +130,13 @@ class TestContentAnalyzer:
         assert faq_analysis["has_faq_page"], "Should detect FAQ page"
         assert faq_analysis["points"] >= 2, "Should award points for FAQ page"
 
+    def test_detect_faq_page_leaves_pages_untouched(self):
+        """FAQ detection must not write into the caller's crawled pages"""
+        pages = [{"url": "/faq", "title": "FAQ Page"}, {"url": "/about", "title": "About"}]
+        self.analyzer.detect_faq_pages(pages)
+
+        assert pages == [{"url": "/faq", "title": "FAQ Page"}, {"url": "/about", "title": "About"}]
+
     def test_detect_faq_schema(self):
         """Test FAQPage schema detection in content analyzer"""
         html = """
@@ -174,6 +181,42 @@ class TestContentAnalyzer:
         assert result["count"] >= 10, f"Should find 10 questions, found {result['count']}"
         assert result["points"] == 2, "Should award 2 points for 10+ questions"
 
+    def test_question_headers_with_xml_declaration(self):
+        """Documents with an XML encoding declaration still yield their headers"""
+        html = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            '<html><body><h2>Qué es SEO?</h2><h3>How does it work?</h3></body></html>'
+        )
+        result = self.analyzer.find_question_headers(html)
+
+        assert result["count"] == 2
+        assert result["examples"] == ["Qué es SEO?", "How does it work?"]
+
+    def test_question_headers_comment_only(self):
+        """A document with no elements has no question headers"""
+        for html in ("<!-- nothing here -->", "  \n  "):
+            result = self.analyzer.find_question_headers(html)
+
+            assert result["count"] == 0
+            assert result["points"] == 0
+
+    def test_extract_text_with_xml_declaration(self):
+        """Documents with an XML encoding declaration still yield their text"""
+        html = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            '<html><body><p>Qué es SEO?</p>\n<script>var x;</script><p>Search.</p></body></html>'
+        )
+
+        assert self.analyzer.extract_text_from_html(html) == "Qué es SEO? Search."
+
+    def test_extract_text_comment_only(self):
+        """A document with no elements has no text"""
+        for html in ("<!-- nothing here -->", "  \n  "):
+            assert self.analyzer.extract_text_from_html(html) == ""
+
+            result = self.analyzer.calculate_readability(html)
+            assert result["difficulty"] == "insufficient_text"
+
     def test_is_question(self):
         """Test question detection logic"""
         assert self.analyzer.is_question("How do we help?"), "Should detect question with '?'"
@@ -206,6 +249,16 @@ class TestContentAnalyzer:
             f"Perfect site should score 7-8 points, got {result['conversational_score']}"
         assert result["max_score"] == 8
 
+    def test_batch_scores_match_single(self):
+        """Test batch scoring returns the same results, in order, as single calls"""
+        sites = [generate_perfect_site(), generate_poor_site(), generate_perfect_site()]
+        batch = self.analyzer.calculate_conversational_scores_batch(sites, max_workers=2)
+
+        assert [r["conversational_score"] for r in batch] == [
+            self.analyzer.calculate_conversational_score(site)["conversational_score"]
+            for site in sites
+        ]
+
 
 class TestEntityChecker:
     """Test entity clarity checking"""
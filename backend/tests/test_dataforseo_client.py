@@ -0,0 +1,342 @@
+"""
+Tests for the DataForSEO client against a local aiohttp server
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+from app.services.dataforseo_client import DataForSEOClient
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch):
+    monkeypatch.setenv("DATAFORSEO_LOGIN", "login")
+    monkeypatch.setenv("DATAFORSEO_PASSWORD", "password")
+
+
+@asynccontextmanager
+async def serve(routes):
+    """Run an aiohttp app with the given (method, path, handler) routes; yields a client"""
+    app = web.Application()
+    for method, path, handler in routes:
+        app.router.add_route(method, "/v3/" + path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        async with DataForSEOClient() as client:
+            client.base_url = f"http://127.0.0.1:{port}/v3"
+            client.retry_delay = 0.01
+            yield client
+    finally:
+        await runner.cleanup()
+
+
+def ok(body=None):
+    return web.json_response(body or {"status_code": 20000, "tasks": []})
+
+
+class TestConcurrencyLimit:
+    """AIMD concurrency control"""
+
+    def test_decrease_applies_to_waiting_requests(self):
+        """After a 429 halves the limit, the server never sees more than the new limit"""
+        state = {"in_flight": 0, "rate_limited": False, "after_429": []}
+
+        async def handler(request):
+            state["in_flight"] += 1
+            try:
+                if not state["rate_limited"]:
+                    state["rate_limited"] = True
+                    return web.Response(status=429, headers={"Retry-After": "0"})
+                state["after_429"].append(state["in_flight"])
+                await asyncio.sleep(0.05)
+                return ok()
+            finally:
+                state["in_flight"] -= 1
+
+        async def run():
+            async with serve([("GET", "ping", handler)]) as client:
+                # No additive increase, so the halved limit holds
+                client._latency_target = 0
+                await asyncio.gather(*(client._make_request("GET", "ping") for _ in range(24)))
+                return client._limiter.limit
+
+        limit = asyncio.run(run())
+
+        assert limit == 4
+        # Requests already on the wire drain; none are admitted above the new limit
+        assert len(state["after_429"]) == 24
+        assert max(state["after_429"][8:]) <= 4
+
+
+class TestRetries:
+    """Retry handling in _make_request"""
+
+    def test_429_honours_retry_after(self):
+        """A 429 is retried after the server's Retry-After delay"""
+        calls = []
+
+        async def handler(request):
+            calls.append(asyncio.get_running_loop().time())
+            if len(calls) == 1:
+                return web.Response(status=429, headers={"Retry-After": "0.3"})
+            return ok()
+
+        async def run():
+            async with serve([("GET", "ping", handler)]) as client:
+                return await client._make_request("GET", "ping")
+
+        result = asyncio.run(run())
+
+        assert result["status_code"] == 20000
+        assert len(calls) == 2
+        assert calls[1] - calls[0] >= 0.3
+
+    def test_5xx_retried_then_succeeds(self):
+        """Server errors are retried with backoff"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            if len(calls) < 3:
+                return web.Response(status=503)
+            return ok()
+
+        async def run():
+            async with serve([("GET", "ping", handler)]) as client:
+                return await client._make_request("GET", "ping")
+
+        assert asyncio.run(run())["status_code"] == 20000
+        assert len(calls) == 3
+
+    def test_5xx_gives_up_after_max_retries(self):
+        """Persistent server errors raise after max_retries retries"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            return web.Response(status=500)
+
+        async def run():
+            async with serve([("GET", "ping", handler)]) as client:
+                await client._make_request("GET", "ping")
+
+        with pytest.raises(Exception, match="Server error 500"):
+            asyncio.run(run())
+        assert len(calls) == 4
+
+    def test_4xx_not_retried(self):
+        """Client errors fail immediately"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            return web.Response(status=404, text="missing")
+
+        async def run():
+            async with serve([("GET", "ping", handler)]) as client:
+                await client._make_request("GET", "ping")
+
+        with pytest.raises(Exception, match="Client error 404"):
+            asyncio.run(run())
+        assert len(calls) == 1
+
+
+class TestRateWindow:
+    """Requests-per-minute sliding window"""
+
+    def test_waits_for_the_oldest_request_to_leave_the_window(self, monkeypatch):
+        from app.services import dataforseo_client
+
+        clock = {"now": 1000.0}
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock["now"] += delay
+            await real_sleep(0)
+
+        monkeypatch.setattr(dataforseo_client.time, "monotonic", lambda: clock["now"])
+        monkeypatch.setattr(dataforseo_client.asyncio, "sleep", fake_sleep)
+
+        async def run():
+            client = DataForSEOClient()
+            client._rpm_limit = 3
+            for _ in range(5):
+                await client._wait_if_throttled()
+            return list(client._req_times)
+
+        req_times = asyncio.run(run())
+
+        # The fourth request waits out the window; by the fifth the first
+        # three have left it
+        assert sleeps == [60.0]
+        assert req_times == [1060.0, 1060.0]
+
+
+class TestSharedRequests:
+    """Single-flight task_status and the tasks_ready cache"""
+
+    def test_task_status_single_flight(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.match_info["task_id"])
+            await asyncio.sleep(0.05)
+            return ok({
+                "status_code": 20000,
+                "tasks": [{"id": request.match_info["task_id"], "status_code": 20000,
+                           "result": [{"crawl_progress": "finished"}]}]
+            })
+
+        async def run():
+            async with serve([("GET", "on_page/summary/{task_id}", handler)]) as client:
+                first = await asyncio.gather(*(client.task_status("t1") for _ in range(5)))
+                other = await client.task_status("t2")
+                again = await client.task_status("t1")
+                return first, other, again, client._inflight_status
+
+        first, other, again, inflight = asyncio.run(run())
+
+        assert calls == ["t1", "t2", "t1"]
+        assert all(result == first[0] for result in first)
+        assert first[0][0].name == "DONE"
+        assert other[1]["tasks"][0]["id"] == "t2"
+        assert again == first[0]
+        assert inflight == {}
+
+    def test_tasks_ready_cached(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            await asyncio.sleep(0.02)
+            return ok({"status_code": 20000, "result": [{"id": "t1"}]})
+
+        async def run():
+            async with serve([("GET", "on_page/tasks_ready", handler)]) as client:
+                results = await asyncio.gather(*(client.tasks_ready() for _ in range(4)))
+                cached = await client.tasks_ready()
+                client.tasks_ready_ttl = 0
+                fresh = await client.tasks_ready()
+                return results + [cached, fresh]
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert all(result["result"] == [{"id": "t1"}] for result in results)
+
+
+class TestBatching:
+    """task_post_batch / task_get_batch split payloads into 100-task requests"""
+
+    @staticmethod
+    def echo(sizes, key):
+        async def handler(request):
+            items = await request.json()
+            sizes.append(len(items))
+            return ok({
+                "status_code": 20000,
+                "tasks": [{"id": item[key], "status_code": 20100} for item in items]
+            })
+        return handler
+
+    def test_task_post_batch_chunks(self):
+        sizes = []
+        targets = [{"target": f"site{i}.com"} for i in range(250)]
+
+        async def run():
+            async with serve([("POST", "on_page/task_post", self.echo(sizes, "target"))]) as client:
+                return await client.task_post_batch(targets)
+
+        tasks = asyncio.run(run())
+
+        assert sorted(sizes) == [50, 100, 100]
+        assert [task["id"] for task in tasks] == [target["target"] for target in targets]
+
+    def test_task_get_batch_chunks(self):
+        sizes = []
+        task_ids = [f"task-{i}" for i in range(201)]
+
+        async def run():
+            async with serve([("POST", "on_page/pages", self.echo(sizes, "id"))]) as client:
+                return await client.task_get_batch(task_ids)
+
+        tasks = asyncio.run(run())
+
+        assert sorted(sizes) == [1, 100, 100]
+        assert [task["id"] for task in tasks] == task_ids
+
+
+class TestTaskGetStream:
+    """Incremental parsing of on_page/pages"""
+
+    ITEMS = [{"url": f"https://example.com/{i}", "meta": {"title": "t" * 100, "ratio": i / 4}} for i in range(1500)]
+
+    @staticmethod
+    def streaming(body, chunk_size=7000):
+        async def handler(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            for start in range(0, len(body), chunk_size):
+                await response.write(body[start:start + chunk_size])
+                await asyncio.sleep(0)
+            await response.write_eof()
+            return response
+        return handler
+
+    def test_multi_chunk_body(self):
+        body = json.dumps({
+            "status_code": 20000,
+            "tasks": [{"id": "t1", "status_code": 20000, "status_message": "Ok.",
+                       "result": [{"crawl_progress": "finished", "items": self.ITEMS}]}]
+        }).encode()
+        slots_held = []
+
+        async def run():
+            async with serve([("POST", "on_page/pages", self.streaming(body))]) as client:
+                items = []
+                async for item in client.task_get_stream("t1"):
+                    # No concurrency slot is held while the caller has the item
+                    slots_held.append(client._limiter.active)
+                    items.append(item)
+                return items
+
+        assert asyncio.run(run()) == self.ITEMS
+        assert set(slots_held) == {0}
+
+    def test_in_progress_raises(self):
+        body = json.dumps({
+            "status_code": 20000,
+            "tasks": [{"id": "t1", "status_code": 40100, "status_message": "Task In Queue.", "result": None}]
+        }).encode()
+
+        async def run():
+            async with serve([("POST", "on_page/pages", self.streaming(body))]) as client:
+                return [item async for item in client.task_get_stream("t1")]
+
+        with pytest.raises(Exception, match="TASK_IN_QUEUE"):
+            asyncio.run(run())
+
+    def test_error_status_raises_without_retrying(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            return web.Response(status=500, text="boom")
+
+        async def run():
+            async with serve([("POST", "on_page/pages", handler)]) as client:
+                return [item async for item in client.task_get_stream("t1")]
+
+        with pytest.raises(Exception, match="500"):
+            asyncio.run(run())
+        assert len(calls) == 1